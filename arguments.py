@@ -3,11 +3,12 @@
 import argparse
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 
 from model.constants import OptimisationObjectives
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Arguments:  # pylint: disable=too-many-instance-attributes
     """Dataclass to process and store command line arguments."""
 
@@ -19,9 +20,10 @@ class Arguments:  # pylint: disable=too-many-instance-attributes
     battery_degradation_rate: float = field(default_factory=float)
     battery_capex: float = field(default_factory=float)
     solar_capex: float = field(default_factory=float)
-    optimisation_objective: OptimisationObjectives = field(
-        default_factory=OptimisationObjectives
+    optimisation_objective: OptimisationObjectives = (
+        OptimisationObjectives.MINIMISE_BATTERY_CAP
     )
+    cache_dir: Optional[Path] = None
 
     @classmethod
     def process_arguments(cls, args: argparse.Namespace) -> "Arguments":
@@ -41,4 +43,5 @@ class Arguments:  # pylint: disable=too-many-instance-attributes
             battery_capex=args.battery_capex,
             solar_capex=args.solar_capex,
             optimisation_objective=args.optimisation_objective,
+            cache_dir=args.cache_dir,
         )
@@ -0,0 +1,85 @@
+"""File contains code associated with caching pre-processed input data."""
+import hashlib
+import logging
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of pre-processed inputs kept in memory by an InputCache
+IN_MEMORY_CACHE_SIZE = 4
+# Version of the pre-processing and of the schema of the pre-processed data. Must be increased whenever either
+# changes, so data cached by an earlier version is re-created rather than loaded.
+CACHE_VERSION = 1
+
+
+class InputCache:  # pylint: disable=too-few-public-methods
+    """
+    Class responsible for caching pre-processed input data. Cached data is stored on disk as parquet and keyed by a
+    hash of the contents of the source files it was created from and the CACHE_VERSION, so any change to the source
+    files or to the pre-processing results in the data being re-created. The most recently used data is also kept in
+    memory by each InputCache, so runs that share one (e.g. a sweep of scenarios) skip reading it again.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        """
+        Initialises the InputCache class.
+        :param cache_dir: Directory to store the cached data in. If None, the data is only cached in memory.
+        """
+        self.cache_dir = cache_dir
+        self._in_memory: Dict[str, pd.DataFrame] = {}
+
+    def load_or_create(
+        self,
+        name: str,
+        source_paths: List[Path],
+        create: Callable[[], pd.DataFrame],
+    ) -> pd.DataFrame:
+        """
+        Loads the cached data if it exists, otherwise creates the data and caches it.
+        :param name: Name of the cached data
+        :param source_paths: Paths to the files the data is created from
+        :param create: Function that creates the data
+        :return: Pandas dataframe containing the data
+        """
+        cache_name = f"{name}_{self._hash(source_paths)}"
+        if cache_name in self._in_memory:
+            logger.info(f"Using {name} cached in memory 📦")
+            # Copied so changes made by the caller do not affect the cached data
+            return self._in_memory[cache_name].copy()
+
+        cache_path = (
+            Path(self.cache_dir, f"{cache_name}.parquet")
+            if self.cache_dir is not None
+            else None
+        )
+        if cache_path is not None and cache_path.exists():
+            logger.info(f"Loading cached {name} from {cache_path} 📦")
+            data = pd.read_parquet(cache_path)
+        else:
+            data = create()
+            if cache_path is not None:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                data.to_parquet(cache_path, index=False)
+
+        if len(self._in_memory) >= IN_MEMORY_CACHE_SIZE:
+            # Drop the oldest data to bound the memory used by the cache
+            self._in_memory.pop(next(iter(self._in_memory)))
+        self._in_memory[cache_name] = data.copy()
+        return data
+
+    @staticmethod
+    def _hash(source_paths: List[Path]) -> str:
+        """
+        Returns a short hash of the contents of the source files and the CACHE_VERSION.
+        :param source_paths: Paths to the files to hash
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        digest.update(f"{CACHE_VERSION}".encode())
+        for source_path in source_paths:
+            with open(source_path, "rb") as file:
+                while chunk := file.read(1 << 20):
+                    digest.update(chunk)
+        return digest.hexdigest()
@@ -1,10 +1,11 @@
 """File contains code associated with loading the input data."""
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import pandas as pd
 
+from model.constants import DATE_TIME
 from model.inputs.pre_processing import PreProcessorBase
 
 logger = logging.getLogger(__name__)
@@ -30,9 +31,23 @@ class InputLoader:  # pylint: disable=too-few-public-methods
         """
         logger.info(f"Reading file at {file_path} 📖")
         try:
-            if self.pre_processor is not None:
-                return self.pre_processor.pre_process(pd.read_csv(file_path))
-            return pd.read_csv(file_path)
+            data = pd.read_csv(
+                file_path,
+                engine="pyarrow",
+                usecols=self._columns_to_read(),
+            )
         except IOError:
             logger.error(f"Could not read file at {file_path}")
             raise
+        if self.pre_processor is not None:
+            return self.pre_processor.pre_process(data)
+        return data
+
+    def _columns_to_read(self) -> Optional[List[str]]:
+        """
+        Returns the columns required by the pre-processor, so that only these columns are parsed from the file. If
+        there is no pre-processor, or it does not specify a column, all columns are read.
+        """
+        if self.pre_processor is None or self.pre_processor.column is None:
+            return None
+        return [DATE_TIME, self.pre_processor.column]
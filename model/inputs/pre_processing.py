@@ -1,10 +1,19 @@
 """
 This file contains all code associated with pre-processing the input data.
 """
-
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from model.constants import (
+    DATE_TIME,
+    DATE_TIME_FORMAT,
+    ENERGY_DEMAND,
+    SOLAR_IRRADIANCE,
+)
 
-from model.constants import DATE_TIME, ENERGY_DEMAND, SOLAR_IRRADIANCE
+HALF_HOUR_NS = 30 * 60 * 1_000_000_000
 
 
 class PreProcessorBase:  # pylint: disable=too-few-public-methods
@@ -28,11 +37,34 @@ class PreProcessorBase:  # pylint: disable=too-few-public-methods
         :param data: Input data to pre-process
         :return: Pre-processed data
         """
-        data[DATE_TIME] = pd.to_datetime(data[DATE_TIME], format="%d/%m/%Y %H:%M")
+        data[DATE_TIME] = self._convert_timestamps(data[DATE_TIME])
         data = self._process_duplicate_timestamps(data, column=self.column)
 
         return data
 
+    @staticmethod
+    def _convert_timestamps(timestamps: pd.Series) -> pd.Series:
+        """
+        Method that converts a column of timestamp strings to datetime objects. The strings are parsed with pyarrow's
+        vectorised strptime, which is much faster than pd.to_datetime for a fixed format. Anything pyarrow cannot
+        parse (e.g. a column that is already datetime) is passed to pd.to_datetime instead.
+
+        :param timestamps: Timestamps to convert
+        """
+        try:
+            converted = pc.strptime(  # pylint: disable=no-member
+                pa.array(timestamps), format=DATE_TIME_FORMAT, unit="ns"
+            )
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+            return pd.to_datetime(
+                timestamps, format=DATE_TIME_FORMAT, cache=True, exact=True
+            )
+        return pd.Series(
+            converted.to_numpy(zero_copy_only=False),
+            index=timestamps.index,
+            name=timestamps.name,
+        )
+
     @staticmethod
     def _process_duplicate_timestamps(data: pd.DataFrame, column: str) -> pd.DataFrame:
         """
@@ -43,47 +75,13 @@ class PreProcessorBase:  # pylint: disable=too-few-public-methods
         :param data: Dataframe to process
         :param column: Column to process
         """
-        # Find duplicate rows based on the timestamp column
-        duplicate_rows = data[data[DATE_TIME].duplicated(keep=False)]
-        if duplicate_rows.empty:
+        if not data[DATE_TIME].duplicated().any():
             return data
-        # Get the unique timestamps
-        unique_timestamps = duplicate_rows[DATE_TIME].unique()
-        # Drop the duplicate timestamps from the original dataframe
-        data = data[~data[DATE_TIME].isin(unique_timestamps)]
-
-        processed_data = pd.DataFrame(columns=data.columns)
-        for timestamp in unique_timestamps:
-            # Get the rows with the timestamp
-            rows = duplicate_rows[duplicate_rows[DATE_TIME] == timestamp]
-            # If there is only one row then add it to the processed data
-            if len(rows) == 1:
-                processed_data = pd.concat([processed_data, rows], ignore_index=True)
-            # If there are multiple rows then process the rows
-            else:
-                # Get the unique values
-                unique_values = rows[column].unique()
-                # If there is only one unique value then add the row to the processed data
-                if len(unique_values) == 1:
-                    if processed_data.empty:
-                        processed_data = rows.drop_duplicates()
-                    else:
-                        processed_data = pd.concat(
-                            [processed_data, rows.drop_duplicates()], ignore_index=True
-                        )
-                # If multiple values, then take the average
-                else:
-                    rows[column] = rows[column].mean()
-                    if processed_data.empty:
-                        processed_data = rows.drop_duplicates()
-                    else:
-                        processed_data = pd.concat(
-                            [processed_data, rows.drop_duplicates()], ignore_index=True
-                        )
-
-        processed_data = pd.concat([processed_data, data])
-        processed_data.sort_values(by=DATE_TIME, inplace=True)
-        return processed_data
+        # Collapse each timestamp to a single row in one pass, averaging the values of the processed column.
+        # Rows with identical values average to that same value, so no separate drop_duplicates step is needed.
+        aggregations = {col: "first" for col in data.columns if col != DATE_TIME}
+        aggregations[column] = "mean"
+        return data.groupby(DATE_TIME, sort=True, as_index=False).agg(aggregations)
 
 
 class PreProcessEnergyDemand(
@@ -109,7 +107,10 @@ class PreProcessEnergyDemand(
         :return: Pre-processed data
         """
         data = super().pre_process(data)
-        return data[data[DATE_TIME].dt.minute.isin([0, 30])]
+        # Timestamps on the half hour are exact multiples of 30 minutes since the epoch, so check this directly on the
+        # underlying nanosecond integers
+        nanoseconds = data[DATE_TIME].to_numpy(dtype="datetime64[ns]").view("i8")
+        return data[nanoseconds % HALF_HOUR_NS == 0].reset_index(drop=True)
 
 
 class PreProcessSolarIrradiance(PreProcessorBase):
@@ -123,7 +124,9 @@ class PreProcessSolarIrradiance(PreProcessorBase):
         self, energy_demand_profile: pd.DataFrame, column: str = SOLAR_IRRADIANCE
     ):
         super().__init__(column=column)
-        self.energy_demand_profile = energy_demand_profile.copy().set_index(DATE_TIME)
+        # set_index returns a new dataframe, so the caller's energy demand profile is left untouched without an extra
+        # copy
+        self.energy_demand_profile = energy_demand_profile.set_index(DATE_TIME)
 
     def pre_process(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -157,106 +160,96 @@ class PreProcessSolarIrradiance(PreProcessorBase):
             "30min"
         ).bfill()
 
-        orginal_columns = data_with_converted_timestamp.columns
-
         # Need to add the very last 30 minutes of the year to the end of the data
         new_timestamp = data_with_converted_timestamp.index[-1] + pd.Timedelta(
             minutes=30
         )
-        last_value = data_with_converted_timestamp.iloc[-1][SOLAR_IRRADIANCE]
+        last_value = data_with_converted_timestamp[SOLAR_IRRADIANCE].iat[-1]
         new_row = pd.DataFrame({SOLAR_IRRADIANCE: [last_value]}, index=[new_timestamp])
         data_with_resampled_timestamp = pd.concat(
             [data_with_converted_timestamp, new_row]
         )
 
-        # Get the years of the energy demand data and the year of the solar irradiance data
-        energy_demand_years = self.energy_demand_profile.index.year.unique()
-
-        # Shift and repeat the solar irradiance data to match the energy demand data
-        shifted_and_repeated_solar_irradiance_list = []
-        for year in energy_demand_years:
-            # Change the year of the solar irradiance data to match the year
-            shifted_solar_irradiance = data_with_resampled_timestamp.copy()
-            for row in shifted_solar_irradiance.index:
-                try:
-                    shifted_solar_irradiance.at[row, DATE_TIME] = row.replace(year=year)
-                except ValueError as error:
-                    # If the date does not exist in the year, then it must be a leap year and drop
-                    # the 29th of February
-                    if row.month == 2 and row.day == 29:
-                        shifted_solar_irradiance.drop(row, inplace=True)
-                    else:
-                        raise ValueError(
-                            f"Unknown error occurred when changing the year of the solar irradiance data to {year}"
-                        ) from error
-            # replace the index with the datetime column
-            shifted_solar_irradiance.set_index(DATE_TIME, inplace=True)
-            shifted_and_repeated_solar_irradiance_list.append(shifted_solar_irradiance)
-
-        shifted_and_repeated_solar_irradiance = pd.concat(
-            shifted_and_repeated_solar_irradiance_list
-        )
-
-        # merge the solar irradiance data with the energy demand data
-        shifted_and_repeated_solar_irradiance = self.energy_demand_profile.merge(
-            shifted_and_repeated_solar_irradiance,
-            left_index=True,
-            right_index=True,
-            how="left",
+        # Look up the solar irradiance at the same time of year as each energy demand timestamp. This shifts and
+        # repeats the single year of solar irradiance data across all the years of the energy demand data. If the
+        # solar irradiance data covers more than one year, the first value at each time of year is used.
+        time_of_year = pd.Index(self._time_of_year(data_with_resampled_timestamp.index))
+        first = ~time_of_year.duplicated(keep="first")
+        positions = time_of_year[first].get_indexer(
+            self._time_of_year(self.energy_demand_profile.index)
         )
         # If there are any missing values raise an error
-        if shifted_and_repeated_solar_irradiance.isna().values.any():
+        if (positions == -1).any():
             raise ValueError(
                 "There are missing values in the energy demand profile after merging the solar irradiance data"
             )
-        # Drop the consumption column
-        shifted_and_repeated_solar_irradiance = shifted_and_repeated_solar_irradiance[
-            orginal_columns
-        ]
-        # Reset the index
-        shifted_and_repeated_solar_irradiance.reset_index(inplace=True)
+        return pd.DataFrame(
+            {
+                DATE_TIME: self.energy_demand_profile.index,
+                SOLAR_IRRADIANCE: data_with_resampled_timestamp[
+                    SOLAR_IRRADIANCE
+                ].to_numpy()[first][positions],
+            }
+        )
+
+    @staticmethod
+    def _time_of_year(timestamps: pd.DatetimeIndex) -> np.ndarray:
+        """
+        Method that encodes the month, day, hour and minute of each timestamp as a single integer, so timestamps at
+        the same time of year in different years have the same value. The 29th of February only exists in leap years,
+        so energy demand data on that day can only be matched to solar irradiance data for a leap year.
 
-        return shifted_and_repeated_solar_irradiance
+        :param timestamps: Timestamps to encode
+        :return: Time of year of each timestamp
+        """
+        return (
+            (timestamps.month.to_numpy() * 100 + timestamps.day.to_numpy()) * 10000
+            + timestamps.hour.to_numpy() * 100
+            + timestamps.minute.to_numpy()
+        )
 
     @staticmethod
     def fill_in_zero_values(solar_irradiance: pd.DataFrame) -> pd.DataFrame:
         """
-        Method to loop through each day, compare the solar irradiance values to the previous day and if the solar
-        irradiance values are zero for any time period that the previous day had values, then the solar irradiance
-        values are replaced with the previous day's values.
+        Method to compare the solar irradiance values of each day to the previous day and if the solar irradiance
+        values are zero for any time period that the previous day had values, then the solar irradiance values are
+        replaced with the previous day's values.
+
+        The data is pivoted to a day x time-of-day matrix so the comparison is done in a single vectorised pass. As the
+        previous day may itself have been filled, each zero value takes the value of the closest earlier day with a
+        non-zero value at that time of day, restarted whenever there is a gap in the days. Missing (NaN) values are
+        kept, and zero values following them are also missing.
         """
-        days = solar_irradiance[DATE_TIME].dt.date.unique()
-        # Loop through each day
-        for day in days:
-            # Get the solar irradiance data for the day
-            solar_irradiance_day = solar_irradiance[
-                solar_irradiance[DATE_TIME].dt.date == day
-            ]
-            # Get the previous day
-            previous_day = day - pd.Timedelta(days=1)
-            # Get the solar irradiance data for the previous day
-            solar_irradiance_previous_day = solar_irradiance[
-                solar_irradiance[DATE_TIME].dt.date == previous_day
-            ]
-            if solar_irradiance_previous_day.empty:
-                continue
-            # Loop through each time period
-            for time_period in solar_irradiance_day[DATE_TIME].dt.time.unique():
-                # Get the solar irradiance value for the time period
-                solar_irradiance_value = solar_irradiance_day[
-                    solar_irradiance_day[DATE_TIME].dt.time == time_period
-                ][SOLAR_IRRADIANCE].values[0]
-                # If the solar irradiance value is zero
-                if solar_irradiance_value == 0:
-                    # Get the solar irradiance value for the previous day
-                    solar_irradiance_previous_day_value = solar_irradiance_previous_day[
-                        solar_irradiance_previous_day[DATE_TIME].dt.time == time_period
-                    ][SOLAR_IRRADIANCE].values[0]
-                    # If the solar irradiance value for the previous day is not zero then replace the value
-                    if solar_irradiance_previous_day_value != 0:
-                        solar_irradiance.loc[
-                            (solar_irradiance[DATE_TIME].dt.date == day)
-                            & (solar_irradiance[DATE_TIME].dt.time == time_period),
-                            SOLAR_IRRADIANCE,
-                        ] = solar_irradiance_previous_day_value
+        days = solar_irradiance[DATE_TIME].dt.normalize()
+        day_and_time = pd.MultiIndex.from_arrays(
+            [days, solar_irradiance[DATE_TIME] - days]
+        )
+        irradiance = pd.Series(
+            solar_irradiance[SOLAR_IRRADIANCE].to_numpy(), index=day_and_time
+        ).unstack()
+        # Days are only filled from the previous calendar day, so group runs of consecutive days
+        consecutive_days = (
+            irradiance.index.to_series().diff() != pd.Timedelta(days=1)
+        ).cumsum()
+        # Forward fill the row of the day each value is taken from rather than the values themselves, so that missing
+        # values are carried forward like any other value
+        rows = np.arange(len(irradiance), dtype=np.float64)[:, np.newaxis]
+        source_rows = (
+            pd.DataFrame(np.where(irradiance.eq(0), np.nan, rows))
+            .groupby(consecutive_days.to_numpy())
+            .ffill()
+            .to_numpy()
+        )
+        # Zero values on the first day of a run have no previous day to take a value from, so are kept
+        source_rows = np.where(np.isnan(source_rows), rows, source_rows).astype(
+            np.int64
+        )
+        filled = pd.DataFrame(
+            np.take_along_axis(irradiance.to_numpy(), source_rows, axis=0),
+            index=irradiance.index,
+            columns=irradiance.columns,
+        )
+        solar_irradiance[SOLAR_IRRADIANCE] = (
+            filled.stack().reindex(day_and_time).to_numpy()
+        )
         return solar_irradiance
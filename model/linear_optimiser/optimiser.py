@@ -1,14 +1,17 @@
 """
 Module containing all code associated with building the linear optimisation problem.
 """
+import copy
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Union
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import pulp as pl
+import pyarrow as pa
 from pulp import LpStatus
+from pyarrow import csv
 
 from model.constants import (
     ENERGY_DEMAND,
@@ -16,6 +19,10 @@ from model.constants import (
     OptimisationObjectives,
     Wh_TO_KWh,
 )
+from model.linear_optimiser.sparse_problem import (
+    SparseProblem,
+    build_constraint_matrices,
+)
 from model.linear_optimiser.variables import OptimiserVariables
 
 logger = logging.getLogger(__name__)
@@ -27,37 +34,47 @@ class Optimiser:  # pylint: disable=too-many-instance-attributes
     """
 
     problem: pl.LpProblem = None
+    sparse_problem: Optional[SparseProblem] = None
     variables: OptimiserVariables
+    _warm_start_values: Optional[Dict[str, float]] = None
 
     def __init__(  # pylint: disable=too-many-arguments
         self,
-        energy_demand: pd.DataFrame,
-        solar_irradiance: pd.DataFrame,
-        time_slices: range,
+        energy_demand: Union[pd.DataFrame, np.ndarray],
+        solar_irradiance: Union[pd.DataFrame, np.ndarray],
+        time_slices: Union[range, np.ndarray],
         optimisation_objective: OptimisationObjectives,
         solar_size: float = None,
         solar_capex: Optional[float] = None,
         battery_capex: Optional[float] = None,
+        solver: Optional[pl.LpSolver] = None,
     ):
         """
         Initialises the optimiser by creating the optimiser variables.
-        :param energy_demand: Energy demand profile (kWh)
-        :param solar_irradiance: Solar irradiance profile (W/m2)
+        :param energy_demand: Energy demand profile (kWh), either as a dataframe or as an array of values
+        :param solar_irradiance: Solar irradiance profile (W/m2), either as a dataframe or as an array of values
         :param time_slices: Time slices to optimise over
         :param optimisation_objective: Optimisation objective
         :param solar_size: Size of the solar array in m^2 (only used when optimising the battery size)
         :param solar_capex: Solar capex (£/m2) (only used when optimising the battery and PV costs)
         :param battery_capex: Battery capex (£/kWh) (only used when optimising the battery and PV costs)
+        :param solver: Solver used to solve the optimisation problem. If None, linear problems are solved in-process
+            with HiGHS through scipy's linprog.
         """
-        self.energy_demand = energy_demand
-        self.solar_irradiance = solar_irradiance
+        # Only the values of the profiles are used, so store them as arrays rather than dataframes
+        self.energy_demand = self._profile_values(energy_demand, column=ENERGY_DEMAND)
+        self.solar_irradiance = self._profile_values(
+            solar_irradiance, column=SOLAR_IRRADIANCE
+        )
+        # The time slices are stored as an array, as they are used to index the profile arrays
+        self.time_slices = np.asarray(time_slices, dtype=np.int64)
         self.variables = OptimiserVariables.create_variables(
-            time_slices=time_slices,
+            time_slices=self.time_slices,
             optimisation_objective=optimisation_objective,
             solar_size=solar_size,
         )
         self.optimisation_objective = optimisation_objective
-        self.time_slices = time_slices
+        self.solver = solver
         if (
             self.optimisation_objective
             == OptimisationObjectives.MINIMISE_BATTERY_AND_SOLAR_COST
@@ -74,7 +91,7 @@ class Optimiser:  # pylint: disable=too-many-instance-attributes
         battery_degradation_rate: float,
         solar_efficiency: Optional[float] = 0.15,
     ) -> None:
-        # pylint: disable=unsubscriptable-object
+        # pylint: disable=unsubscriptable-object,too-many-locals
         """
         Main entry point to the optimiser. Calls the following functions:
             - define the object function
@@ -87,65 +104,189 @@ class Optimiser:  # pylint: disable=too-many-instance-attributes
         :return: None
         """
         self._define_problem()
+        self.sparse_problem = None
         self._define_objective_function(
             battery_capex=self.battery_capex,
             solar_capex=self.solar_capex,
         )
         # Define the constraints
-        for _t in self.time_slices:
-            # Solar generation
-            solar_generation = (
-                self.solar_irradiance[SOLAR_IRRADIANCE][_t]
-                * self.variables.solar_size
-                * solar_efficiency
-                * 0.5
-                * Wh_TO_KWh
+        # Local aliases to avoid repeated attribute lookups in the loop below
+        rth = self.variables.renewable_electricity_to_house
+        rtb = self.variables.renewable_electricity_to_battery
+        bth = self.variables.battery_electricity_to_house
+        soc = self.variables.battery_state_of_charge
+        battery_capacity = self.variables.battery_capacity
+        solar_size = self.variables.solar_size
+        # The profiles are converted to lists of floats as these are faster to index one element at a time than
+        # numpy arrays
+        energy_demand = self.energy_demand.tolist()
+        solar_size_is_variable = isinstance(solar_size, pl.LpVariable)
+        # When the solar size is optimised this is the solar generation per unit of solar array size, otherwise the
+        # solar size is fixed and this is the solar generation itself. The scalar factors are combined first so the
+        # irradiance is only multiplied once.
+        generation_factor = solar_efficiency * 0.5 * Wh_TO_KWh
+        solar_generation = (
+            self.solar_irradiance
+            * (
+                generation_factor
+                if solar_size_is_variable
+                else generation_factor * solar_size
             )
+        ).tolist()
+        # Constraints are built directly from (variable, coefficient) pairs, which avoids the temporary expressions
+        # that are created when combining variables with arithmetic operators. They are given explicit names and
+        # collected so they can be added to the problem in one go.
+        constraints = {}
+        for _t in self.time_slices.tolist():
             # Renewable electricity flow from PV to house and battery must leq than renewable generation
-            self.problem += (
-                self.variables.renewable_electricity_to_house[_t]
-                + self.variables.renewable_electricity_to_battery[_t]
-                <= solar_generation
-            )
+            if solar_size_is_variable:
+                constraints[f"gen_{_t}"] = pl.LpConstraint(
+                    pl.LpAffineExpression(
+                        [
+                            (rth[_t], 1),
+                            (rtb[_t], 1),
+                            (solar_size, -solar_generation[_t]),
+                        ]
+                    ),
+                    sense=pl.LpConstraintLE,
+                    rhs=0,
+                )
+            else:
+                constraints[f"gen_{_t}"] = pl.LpConstraint(
+                    pl.LpAffineExpression([(rth[_t], 1), (rtb[_t], 1)]),
+                    sense=pl.LpConstraintLE,
+                    rhs=solar_generation[_t],
+                )
             # Electricity demand from house must be met
-            self.problem += (
-                self.variables.renewable_electricity_to_house[_t]
-                + self.variables.battery_electricity_to_house[_t]
-                == self.energy_demand.loc[_t, ENERGY_DEMAND]
+            constraints[f"dem_{_t}"] = pl.LpConstraint(
+                pl.LpAffineExpression([(rth[_t], 1), (bth[_t], 1)]),
+                sense=pl.LpConstraintEQ,
+                rhs=energy_demand[_t],
             )
             # Battery state of charge
             if _t == 0:  # Initial battery state of charge
-                self.problem += (
-                    self.variables.battery_state_of_charge[_t]
-                    == battery_initial_capacity
+                constraints[f"soc_{_t}"] = pl.LpConstraint(
+                    pl.LpAffineExpression([(soc[_t], 1)]),
+                    sense=pl.LpConstraintEQ,
+                    rhs=battery_initial_capacity,
                 )
             else:
                 # Battery state of charge must be equal to the previous state plus the electricity flow to the battery
                 # minus the electricity flow from the battery and the degradation
-                battery_degradation = (
-                    battery_degradation_rate
-                    * self.variables.battery_state_of_charge[_t - 1]
-                )
-                self.problem += (
-                    self.variables.battery_state_of_charge[_t]
-                    == self.variables.battery_state_of_charge[_t - 1]
-                    + self.variables.renewable_electricity_to_battery[_t]
-                    - self.variables.battery_electricity_to_house[_t]
-                    - battery_degradation
+                constraints[f"soc_{_t}"] = pl.LpConstraint(
+                    pl.LpAffineExpression(
+                        [
+                            (soc[_t], 1),
+                            (soc[_t - 1], -(1 - battery_degradation_rate)),
+                            (rtb[_t], -1),
+                            (bth[_t], 1),
+                        ]
+                    ),
+                    sense=pl.LpConstraintEQ,
+                    rhs=0,
                 )
             # Battery capacity must be greater than or equal to the battery state of charge
-            self.problem += (
-                self.variables.battery_state_of_charge[_t]
-                <= self.variables.battery_capacity
+            constraints[f"cap_{_t}"] = pl.LpConstraint(
+                pl.LpAffineExpression([(soc[_t], 1), (battery_capacity, -1)]),
+                sense=pl.LpConstraintLE,
+                rhs=0,
             )
+        # Add all the constraints to the problem at once
+        self.problem.extend(constraints)
+
+    def create_optimisation_problem_sparse(
+        self,
+        battery_initial_capacity: float,
+        battery_degradation_rate: float,
+        solar_efficiency: Optional[float] = 0.15,
+    ) -> None:
+        """
+        Alternative to create_optimisation_problem that builds the constraints directly as sparse matrices instead of
+        PuLP expressions, which is much faster for long time horizons. The problem is solved with HiGHS through
+        scipy's linprog when solve is called, and the solution is written back to the optimiser variables so the
+        results can be used in the same way.
+        :param battery_initial_capacity: Initial battery capacity (kWh)
+        :param battery_degradation_rate: Battery degradation rate, in (kWh/kWh)
+        :param solar_efficiency: Solar efficiency (%). Default is 15%.
+        :return: None
+        """
+        # The PuLP problem only holds the objective function
+        self._define_problem()
+        self._define_objective_function(
+            battery_capex=self.battery_capex,
+            solar_capex=self.solar_capex,
+        )
+        # Variables in the column order of the constraint matrices built by build_constraint_matrices
+        variables = [
+            *self.variables.time_slice_variables,
+            self.variables.battery_capacity,
+        ]
+        solar_size_is_variable = isinstance(self.variables.solar_size, pl.LpVariable)
+        if solar_size_is_variable:
+            variables.append(self.variables.solar_size)
+
+        # Solar generation per unit of solar array size. Only the time slices being optimised over are used, so the
+        # rows of the constraint matrices match the time slice variables.
+        generation_factor = (
+            self.solar_irradiance[self.time_slices] * solar_efficiency * 0.5 * Wh_TO_KWh
+        )
+        a_ub, b_ub, a_eq, b_eq = build_constraint_matrices(
+            battery_initial_capacity=battery_initial_capacity,
+            battery_degradation_rate=battery_degradation_rate,
+            energy_demand=self.energy_demand[self.time_slices],
+            generation_factor=generation_factor,
+            solar_size=None if solar_size_is_variable else self.variables.solar_size,
+        )
+
+        column = {variable.name: index for index, variable in enumerate(variables)}
+        objective = np.zeros(len(variables))
+        for variable, coefficient in self.problem.objective.items():
+            objective[column[variable.name]] = coefficient
 
-    def solve(self) -> None:
+        self.sparse_problem = SparseProblem(
+            variables=variables,
+            objective=objective,
+            a_ub=a_ub,
+            b_ub=b_ub,
+            a_eq=a_eq,
+            b_eq=b_eq,
+        )
+
+    def solve(self, solver: Optional[pl.LpSolver] = None) -> None:
         """
-        Method to solve the optimisation problem.
+        Method to solve the optimisation problem. Without a solver, the problem is solved with HiGHS through scipy's
+        linprog, which does not use a starting solution. Problems built with create_optimisation_problem_sparse are
+        always solved this way. Otherwise the problem is solved with the given PuLP solver, and if the problem has
+        been solved before with the same variables (e.g. when re-solving for a different battery degradation rate),
+        the solver is warm started from the previous solution.
+        :param solver: Solver used to solve the optimisation problem. If None, the optimiser's solver is used.
         """
         if self.problem is None:
             raise ValueError("Optimisation problem has not been defined.")
-        self.problem.solve()
+        solver = solver if solver is not None else self.solver
+        if self.sparse_problem is not None:
+            self.problem.status = self.sparse_problem.solve()
+        elif solver is None:
+            if self.problem.isMIP():
+                raise ValueError(
+                    "A solver must be given to solve a mixed integer problem."
+                )
+            # The problem is handed straight to HiGHS in matrix form, which avoids writing the problem to a file and
+            # parsing the solution of a command line solver
+            self.problem.status = SparseProblem.from_lp_problem(self.problem).solve()
+        else:
+            self.problem.solve(self._apply_warm_start(solver))
+            # The solution is only kept for warm starting PuLP solvers, as linprog cannot use it
+            if self.problem.status == pl.LpStatusOptimal:
+                self._store_warm_start_values()
+        # Evaluating the results is skipped entirely when they would not be logged
+        if logger.isEnabledFor(logging.INFO):
+            self._log_results()
+
+    def _log_results(self) -> None:
+        """
+        Method to log a summary of the results of the optimisation problem.
+        """
         logger.info(f"Status: {LpStatus[self.problem.status]}")
         logger.info(f"Objective: {pl.value(self.problem.objective)}")
         logger.info(f"Battery capacity: {pl.value(self.variables.battery_capacity)}")
@@ -168,100 +309,98 @@ class Optimiser:  # pylint: disable=too-many-instance-attributes
         :param output_dir: Path to the output directory. If None, will not save the plot.
         """
         # pylint: disable=unsubscriptable-object
-        # plot results
-        plt.figure(figsize=(20, 10))
-        plt.plot(
-            [
-                pl.value(self.variables.battery_state_of_charge[t])
-                for t in self.time_slices
-            ],
-            label="Battery state of charge",
+        # Evaluate the solved variables once and derive the totals from these
+        battery_state_of_charge = self._solved_values(
+            self.variables.battery_state_of_charge
         )
-        plt.plot(
-            [
-                pl.value(self.variables.renewable_electricity_to_house[t])
-                for t in self.time_slices
-            ],
-            label="Renewable electricity to house",
+        renewable_electricity_to_house = self._solved_values(
+            self.variables.renewable_electricity_to_house
         )
-        plt.plot(
-            [
-                pl.value(self.variables.battery_electricity_to_house[t])
-                for t in self.time_slices
-            ],
-            label="Battery electricity to house",
+        battery_electricity_to_house = self._solved_values(
+            self.variables.battery_electricity_to_house
         )
-        plt.plot(
-            [
-                pl.value(self.variables.battery_electricity_to_house[t])
-                + pl.value(self.variables.renewable_electricity_to_house[t])
-                for t in self.time_slices
-            ],
-            label="Total electricity to house",
+        total_electricity_to_house = (
+            battery_electricity_to_house + renewable_electricity_to_house
         )
+        # matplotlib is slow to import, so only import it when plotting
+        import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
+        # plot results, with all the series drawn in a single call
+        plt.figure(figsize=(20, 10))
         plt.plot(
+            np.column_stack(
+                [
+                    battery_state_of_charge,
+                    renewable_electricity_to_house,
+                    battery_electricity_to_house,
+                    total_electricity_to_house,
+                    total_electricity_to_house - self.energy_demand[self.time_slices],
+                ]
+            )
+        )
+        plt.legend(
             [
-                pl.value(self.variables.battery_electricity_to_house[t])
-                + pl.value(self.variables.renewable_electricity_to_house[t])
-                - self.energy_demand.loc[t, ENERGY_DEMAND]
-                for t in self.time_slices
-            ],
-            label="Excess electricity",
+                "Battery state of charge",
+                "Renewable electricity to house",
+                "Battery electricity to house",
+                "Total electricity to house",
+                "Excess electricity",
+            ]
         )
-        plt.legend()
-        plt.show()
         if output_dir:
-            # Save the plot
+            # Save the plot before showing it, as showing the plot can clear the figure
+            output_dir.mkdir(parents=True, exist_ok=True)
             plt.savefig(output_dir / "results.png")
+        plt.show()
+        # pyplot keeps a reference to every figure until it is closed, which would otherwise keep the plot of every
+        # run in a sweep alive
+        plt.close()
 
     def dump_results_to_csv(self, output_path: Path) -> None:
         """
         Method to dump the results of the optimisation problem to a csv.
         :param output_path: Path to dump the results to.
         """
+        results = self.results_table()
+        if not output_path.exists():
+            output_path.mkdir(parents=True)
+        # pyarrow's csv writer is considerably faster than DataFrame.to_csv for a full year of results
+        csv.write_csv(results, Path(output_path, "optimisation_output.csv"))
+
+    def results_table(self) -> pa.Table:
+        """
+        Method to get the results of the optimisation problem for each time slice as a table.
+        :return: Results of the optimisation problem
+        """
         # pylint: disable=unsubscriptable-object
+        # Evaluate the solved variables once and derive the totals from these
+        battery_electricity_to_house = self._solved_values(
+            self.variables.battery_electricity_to_house
+        )
+        renewable_electricity_to_house = self._solved_values(
+            self.variables.renewable_electricity_to_house
+        )
+        total_electricity_to_house = (
+            battery_electricity_to_house + renewable_electricity_to_house
+        )
         results = pd.DataFrame(
             {
-                "battery_state_of_charge": [
-                    pl.value(self.variables.battery_state_of_charge[t])
-                    for t in self.time_slices
-                ],
-                "renewable_electricity_to_house": [
-                    pl.value(self.variables.renewable_electricity_to_house[t])
-                    for t in self.time_slices
-                ],
-                "renewable_electricity_to_battery": [
-                    pl.value(self.variables.renewable_electricity_to_battery[t])
-                    for t in self.time_slices
-                ],
-                "battery_electricity_to_house": [
-                    pl.value(self.variables.battery_electricity_to_house[t])
-                    for t in self.time_slices
-                ],
-                "total_electricity_to_house": [
-                    pl.value(self.variables.battery_electricity_to_house[t])
-                    + pl.value(self.variables.renewable_electricity_to_house[t])
-                    for t in self.time_slices
-                ],
-                "energy_demand": [
-                    self.energy_demand.loc[t, ENERGY_DEMAND] for t in self.time_slices
-                ],
-                "solar_generation": [
-                    self.solar_irradiance.loc[t, SOLAR_IRRADIANCE]
-                    * self.variables.solar_size
-                    * 0.5
-                    for t in self.time_slices
-                ],
-                "solar_irradiance": [
-                    self.solar_irradiance.loc[t, SOLAR_IRRADIANCE]
-                    for t in self.time_slices
-                ],
-                "excess_electricity": [
-                    pl.value(self.variables.battery_electricity_to_house[t])
-                    + pl.value(self.variables.renewable_electricity_to_house[t])
-                    - self.energy_demand.loc[t, ENERGY_DEMAND]
-                    for t in self.time_slices
-                ],
+                "battery_state_of_charge": self._solved_values(
+                    self.variables.battery_state_of_charge
+                ),
+                "renewable_electricity_to_house": renewable_electricity_to_house,
+                "renewable_electricity_to_battery": self._solved_values(
+                    self.variables.renewable_electricity_to_battery
+                ),
+                "battery_electricity_to_house": battery_electricity_to_house,
+                "total_electricity_to_house": total_electricity_to_house,
+                "energy_demand": self.energy_demand[self.time_slices],
+                "solar_generation": self.solar_irradiance[self.time_slices]
+                * pl.value(self.variables.solar_size)
+                * 0.5,
+                "solar_irradiance": self.solar_irradiance[self.time_slices],
+                "excess_electricity": total_electricity_to_house
+                - self.energy_demand[self.time_slices],
                 "battery_capacity": pl.value(self.variables.battery_capacity),
                 "solar_size": pl.value(self.variables.solar_size),
             }
@@ -277,10 +416,68 @@ class Optimiser:  # pylint: disable=too-many-instance-attributes
             results["solar_cost"] = (
                 pl.value(self.variables.solar_size) * self.solar_capex
             )
+        return pa.Table.from_pandas(results, preserve_index=False)
 
-        if not output_path.exists():
-            output_path.mkdir(parents=True)
-        results.to_csv(Path(output_path, "optimisation_output.csv"), index=False)
+    def _store_warm_start_values(self) -> None:
+        """
+        Method to store the solution of the problem, so it can be used to warm start the next solve of this
+        optimiser.
+        """
+        self._warm_start_values = {
+            variable.name: variable.varValue for variable in self.problem.variables()
+        }
+
+    @staticmethod
+    def _profile_values(
+        profile: Union[pd.DataFrame, np.ndarray], column: str
+    ) -> np.ndarray:
+        """
+        Method to get the values of an input profile as a float64 array.
+        :param profile: Input profile, either as a dataframe or as an array of values
+        :param column: Column containing the values if the profile is a dataframe
+        :return: Values of the profile
+        """
+        if isinstance(profile, pd.DataFrame):
+            profile = profile[column]
+        return np.asarray(profile, dtype=np.float64)
+
+    def _apply_warm_start(self, solver: pl.LpSolver) -> pl.LpSolver:
+        """
+        Method to set the initial values of the problem variables to the previous solution, so solvers that support
+        it can warm start. The previous solution is only used if the problem has exactly the same variables.
+        :param solver: Solver used to solve the optimisation problem
+        :return: Solver to solve the problem with. When warm starting, this is a copy of the solver with warm starting
+            enabled, so the solver that was given is not changed.
+        """
+        if self._warm_start_values is None:
+            return solver
+        variables = self.problem.variables()
+        if len(variables) != len(self._warm_start_values) or any(
+            variable.name not in self._warm_start_values for variable in variables
+        ):
+            logger.debug(
+                "Problem variables have changed since the last solve, not warm starting"
+            )
+            return solver
+        for variable in variables:
+            variable.setInitialValue(
+                self._warm_start_values[variable.name], check=False
+            )
+        warm_start_solver = copy.copy(solver)
+        warm_start_solver.optionsDict = {**solver.optionsDict, "warmStart": True}
+        return warm_start_solver
+
+    def _solved_values(self, variables: List[pl.LpVariable]) -> np.ndarray:
+        """
+        Method to get the solved values of a set of time slice variables as an array.
+        :param variables: Variables indexed by time slice
+        :return: Solved values of the variables for each time slice
+        """
+        return np.fromiter(
+            (pl.value(variables[t]) for t in self.time_slices.tolist()),
+            dtype=np.float64,
+            count=len(self.time_slices),
+        )
 
     def _define_problem(self):
         """
@@ -0,0 +1,209 @@
+"""
+File containing code associated with solving the linear optimisation problem in sparse matrix form
+"""
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pulp as pl
+from scipy import sparse
+from scipy.optimize import linprog
+
+logger = logging.getLogger(__name__)
+
+# Map from the status codes returned by linprog to the PuLP status codes
+LINPROG_TO_PULP_STATUS = {
+    0: pl.LpStatusOptimal,
+    1: pl.LpStatusNotSolved,
+    2: pl.LpStatusInfeasible,
+    3: pl.LpStatusUnbounded,
+    4: pl.LpStatusUndefined,
+}
+
+
+@dataclass
+class SparseProblem:
+    """
+    Class to store a linear problem in the matrix form used by scipy's linprog, i.e.
+        min c @ x  subject to  a_ub @ x <= b_ub,  a_eq @ x == b_eq,  bounds
+    The columns of the matrices correspond to the PuLP variables, so the solution can be written back to them. If no
+    bounds are given all variables are non-negative.
+    """
+
+    variables: List[pl.LpVariable]
+    objective: np.ndarray
+    a_ub: Optional[sparse.csr_matrix]
+    b_ub: Optional[np.ndarray]
+    a_eq: Optional[sparse.csr_matrix]
+    b_eq: Optional[np.ndarray]
+    bounds: Optional[List[Tuple[Optional[float], Optional[float]]]] = None
+
+    @classmethod
+    def from_lp_problem(cls, problem: pl.LpProblem) -> "SparseProblem":
+        """
+        Function to convert a linear PuLP problem to matrix form. Greater than constraints are negated into less than
+        constraints, and maximisation problems are converted to minimisation problems.
+        :param problem: Linear PuLP problem
+        :return: Sparse problem
+        """
+        # pylint: disable=too-many-locals
+        variables = problem.variables()
+        column = {variable.name: index for index, variable in enumerate(variables)}
+        ub_rows, ub_columns, ub_data, b_ub = [], [], [], []
+        eq_rows, eq_columns, eq_data, b_eq = [], [], [], []
+        for constraint in problem.constraints.values():
+            if constraint.sense == pl.LpConstraintEQ:
+                rows, columns, data, rhs, sign = eq_rows, eq_columns, eq_data, b_eq, 1
+            else:
+                # e + constant <= 0 is stored as e <= -constant, and e + constant >= 0 as -e <= constant
+                rows, columns, data, rhs = ub_rows, ub_columns, ub_data, b_ub
+                sign = -constraint.sense
+            row = len(rhs)
+            for variable, coefficient in constraint.items():
+                rows.append(row)
+                columns.append(column[variable.name])
+                data.append(sign * coefficient)
+            rhs.append(-sign * constraint.constant)
+
+        objective = np.zeros(len(variables))
+        for variable, coefficient in problem.objective.items():
+            objective[column[variable.name]] = coefficient
+        if problem.sense == pl.LpMaximize:
+            objective = -objective
+
+        return cls(
+            variables,
+            objective,
+            *_to_csr(ub_rows, ub_columns, ub_data, b_ub, n_columns=len(variables)),
+            *_to_csr(eq_rows, eq_columns, eq_data, b_eq, n_columns=len(variables)),
+            bounds=[(variable.lowBound, variable.upBound) for variable in variables],
+        )
+
+    def solve(self) -> int:
+        """
+        Method to solve the problem with HiGHS and write the solution back to the PuLP variables. If no solution is
+        found, the values of the variables are cleared, so values from an earlier solve are not mistaken for it.
+        :return: PuLP status of the solution
+        """
+        result = linprog(
+            c=self.objective,
+            A_ub=self.a_ub,
+            b_ub=self.b_ub,
+            A_eq=self.a_eq,
+            b_eq=self.b_eq,
+            bounds=self.bounds if self.bounds is not None else (0, None),
+            method="highs",
+            options={"presolve": True},
+        )
+        logger.debug(f"linprog: {result.message}")
+        values = result.x if result.x is not None else [None] * len(self.variables)
+        for variable, value in zip(self.variables, values):
+            variable.varValue = value
+        return LINPROG_TO_PULP_STATUS[result.status]
+
+
+def _to_csr(
+    rows: List[int],
+    columns: List[int],
+    data: List[float],
+    rhs: List[float],
+    n_columns: int,
+) -> Tuple[Optional[sparse.csr_matrix], Optional[np.ndarray]]:
+    """
+    Function to convert constraint coefficients in coordinate form to a CSR matrix and right hand side array.
+    :param rows: Row of each coefficient
+    :param columns: Column of each coefficient
+    :param data: Value of each coefficient
+    :param rhs: Right hand side of each row
+    :param n_columns: Number of columns of the matrix
+    :return: Constraint matrix and right hand side, or None for both if there are no rows
+    """
+    if not rhs:
+        return None, None
+    matrix = sparse.csr_matrix((data, (rows, columns)), shape=(len(rhs), n_columns))
+    return matrix, np.asarray(rhs, dtype=np.float64)
+
+
+def build_constraint_matrices(  # pylint: disable=too-many-locals
+    battery_initial_capacity: float,
+    battery_degradation_rate: float,
+    energy_demand: np.ndarray,
+    generation_factor: np.ndarray,
+    solar_size: Optional[float] = None,
+) -> Tuple[sparse.csr_matrix, np.ndarray, sparse.csr_matrix, np.ndarray]:
+    """
+    Function to build the constraint matrices of the optimisation problem from purely numeric inputs. The columns are
+    laid out as [rth_0..rth_n, rtb_0..rtb_n, bth_0..bth_n, soc_0..soc_n, battery_capacity, (solar_size)], where the
+    solar size column is only included when the solar size is optimised. The non-zero coefficients are written into
+    preallocated arrays with vectorised slices.
+    :param battery_initial_capacity: Initial battery capacity (kWh)
+    :param battery_degradation_rate: Battery degradation rate, in (kWh/kWh)
+    :param energy_demand: Energy demand for each time slice (kWh)
+    :param generation_factor: Solar generation per unit of solar array size for each time slice (kWh/m2)
+    :param solar_size: Size of the solar array in m^2. If None, the solar size is optimised.
+    :return: Inequality matrix and bounds, equality matrix and bounds
+    """
+    n_time_slices = len(energy_demand)
+    time_slice = np.arange(n_time_slices)
+    rth = time_slice
+    rtb = time_slice + n_time_slices
+    bth = time_slice + 2 * n_time_slices
+    soc = time_slice + 3 * n_time_slices
+    battery_capacity = 4 * n_time_slices
+    n_columns = 4 * n_time_slices + (1 if solar_size is not None else 2)
+
+    # Inequality constraints: rows [0, n) are the solar generation limits and rows [n, 2n) the battery capacity limits
+    n_ub = 4 * n_time_slices + (0 if solar_size is not None else n_time_slices)
+    ub_rows = np.empty(n_ub, dtype=np.int64)
+    ub_columns = np.empty(n_ub, dtype=np.int64)
+    ub_data = np.empty(n_ub, dtype=np.float64)
+    ub_rows[: 2 * n_time_slices] = np.tile(time_slice, 2)
+    ub_columns[: 2 * n_time_slices] = np.concatenate([rth, rtb])
+    ub_data[: 2 * n_time_slices] = 1
+    ub_rows[2 * n_time_slices : 4 * n_time_slices] = np.tile(
+        n_time_slices + time_slice, 2
+    )
+    ub_columns[2 * n_time_slices : 3 * n_time_slices] = soc
+    ub_columns[3 * n_time_slices : 4 * n_time_slices] = battery_capacity
+    ub_data[2 * n_time_slices : 3 * n_time_slices] = 1
+    ub_data[3 * n_time_slices : 4 * n_time_slices] = -1
+    b_ub = np.zeros(2 * n_time_slices)
+    if solar_size is None:
+        ub_rows[4 * n_time_slices :] = time_slice
+        ub_columns[4 * n_time_slices :] = battery_capacity + 1
+        ub_data[4 * n_time_slices :] = -generation_factor
+    else:
+        b_ub[:n_time_slices] = generation_factor * solar_size
+
+    # Equality constraints: rows [0, n) are the energy demand balance and rows [n, 2n) the battery state of charge,
+    # where the first state of charge row sets the initial battery capacity
+    n_recurrence = max(n_time_slices - 1, 0)
+    n_eq = 3 * n_time_slices + 3 * n_recurrence
+    eq_rows = np.empty(n_eq, dtype=np.int64)
+    eq_columns = np.empty(n_eq, dtype=np.int64)
+    eq_data = np.empty(n_eq, dtype=np.float64)
+    eq_rows[: 2 * n_time_slices] = np.tile(time_slice, 2)
+    eq_columns[: 2 * n_time_slices] = np.concatenate([rth, bth])
+    eq_data[: 2 * n_time_slices] = 1
+    eq_rows[2 * n_time_slices : 3 * n_time_slices] = n_time_slices + time_slice
+    eq_columns[2 * n_time_slices : 3 * n_time_slices] = soc
+    eq_data[2 * n_time_slices : 3 * n_time_slices] = 1
+    # State of charge recurrence for t > 0: soc_t - (1 - rate) * soc_t-1 - rtb_t + bth_t = 0
+    eq_rows[3 * n_time_slices :] = np.tile(n_time_slices + time_slice[1:], 3)
+    eq_columns[3 * n_time_slices :] = np.concatenate([soc[:-1], rtb[1:], bth[1:]])
+    eq_data[3 * n_time_slices :] = np.repeat(
+        [-(1 - battery_degradation_rate), -1, 1], n_recurrence
+    )
+    b_eq = np.zeros(2 * n_time_slices)
+    b_eq[:n_time_slices] = energy_demand
+    if n_time_slices > 0:
+        b_eq[n_time_slices] = battery_initial_capacity
+
+    a_ub = sparse.csr_matrix(
+        (ub_data, (ub_rows, ub_columns)), shape=(2 * n_time_slices, n_columns)
+    )
+    a_eq = sparse.csr_matrix(
+        (eq_data, (eq_rows, eq_columns)), shape=(2 * n_time_slices, n_columns)
+    )
+    return a_ub, b_ub, a_eq, b_eq
@@ -2,9 +2,10 @@
 File containing all the variables for the linear optimiser
 """
 import logging
-from dataclasses import dataclass, field
-from typing import Union
+from dataclasses import dataclass
+from typing import List, Union
 
+import numpy as np
 import pulp as pl
 
 from model.constants import OptimisationObjectives
@@ -12,68 +13,84 @@ from model.constants import OptimisationObjectives
 logger = logging.getLogger(__name__)
 
 
+# Short names of the variables defined for every time slice, in the order they are stored in
+TIME_SLICE_VARIABLES = ("rth", "rtb", "bth", "soc")
+
+
 @dataclass
 class OptimiserVariables:
     """
-    Class to store the variables for the optimiser
+    Class to store the variables for the optimiser. The variables defined for every time slice are stored in a single
+    flat list, ordered by variable and then by time slice, so the variable at index i in TIME_SLICE_VARIABLES for time
+    slice t is at i * n_time_slices + t. This is also the column order of the constraint matrices built by
+    build_constraint_matrices.
     """
 
-    renewable_electricity_to_house: pl.LpVariable = field(
-        default_factory=pl.LpVariable, init=False
-    )
-    renewable_electricity_to_battery: pl.LpVariable = field(
-        default_factory=pl.LpVariable, init=False
-    )
-    battery_electricity_to_house: pl.LpVariable = field(
-        default_factory=pl.LpVariable, init=False
-    )
-    battery_state_of_charge: pl.LpVariable = field(
-        default_factory=pl.LpVariable, init=False
-    )
-    battery_capacity: pl.LpVariable = field(default_factory=pl.LpVariable, init=False)
-    solar_size: Union[float, pl.LpVariable] = field(
-        default_factory=pl.LpVariable, init=False
-    )
+    time_slice_variables: List[pl.LpVariable]
+    n_time_slices: int
+    battery_capacity: pl.LpVariable
+    solar_size: Union[float, pl.LpVariable]
+
+    @property
+    def renewable_electricity_to_house(self) -> List[pl.LpVariable]:
+        """
+        Renewable electricity flow from PV to house for each time slice
+        """
+        return self._time_slice_variables("rth")
+
+    @property
+    def renewable_electricity_to_battery(self) -> List[pl.LpVariable]:
+        """
+        Renewable electricity flow from PV to battery for each time slice
+        """
+        return self._time_slice_variables("rtb")
+
+    @property
+    def battery_electricity_to_house(self) -> List[pl.LpVariable]:
+        """
+        Electricity flow from battery to house for each time slice
+        """
+        return self._time_slice_variables("bth")
+
+    @property
+    def battery_state_of_charge(self) -> List[pl.LpVariable]:
+        """
+        Battery state of charge for each time slice
+        """
+        return self._time_slice_variables("soc")
+
+    def _time_slice_variables(self, name: str) -> List[pl.LpVariable]:
+        """
+        Method to get one of the variables defined for every time slice.
+        :param name: Short name of the variable
+        :return: Variables indexed by time slice
+        """
+        start = TIME_SLICE_VARIABLES.index(name) * self.n_time_slices
+        return self.time_slice_variables[start : start + self.n_time_slices]
 
     @classmethod
     def create_variables(
         cls,
-        time_slices: range,
+        time_slices: Union[range, np.ndarray],
         optimisation_objective: OptimisationObjectives,
         solar_size: float = None,
     ) -> "OptimiserVariables":
         """
-        Function to create the variables for the optimiser.
+        Function to create the variables for the optimiser. Variables defined for every time slice are stored in a
+        single list, and are given short names to keep the problem files written for the solver small.
         :param time_slices: Time slices to optimise over
         :param optimisation_objective: Optimisation objective
         :param solar_size: Size of the solar array in m^2
-        :return: None
+        :return: Optimiser variables
         """
-        cls.renewable_electricity_to_house = pl.LpVariable.dicts(
-            name="renewable_electricity_to_house",
-            indices=time_slices,
-            lowBound=0,
-            cat="Continuous",
-        )
-        cls.renewable_electricity_to_battery = pl.LpVariable.dicts(
-            name="renewable_electricity_to_battery",
-            indices=time_slices,
-            lowBound=0,
-            cat="Continuous",
-        )
-        cls.battery_electricity_to_house = pl.LpVariable.dicts(
-            name="battery_electricity_to_house",
-            indices=time_slices,
-            lowBound=0,
-            cat="Continuous",
-        )
-        cls.battery_state_of_charge = pl.LpVariable.dicts(
-            name="battery_state_of_charge",
-            indices=time_slices,
-            lowBound=0,
-            cat="Continuous",
-        )
-        cls.battery_capacity = pl.LpVariable(
+        # Each time slice is converted to a string once, rather than once per variable
+        time_slice_names = [str(t) for t in time_slices]
+        time_slice_variables = [
+            pl.LpVariable(name=f"{name}_{t}", lowBound=0, cat="Continuous")
+            for name in TIME_SLICE_VARIABLES
+            for t in time_slice_names
+        ]
+        battery_capacity = pl.LpVariable(
             name="battery_capacity",
             lowBound=0,
             cat="Continuous",
@@ -88,15 +105,19 @@ class OptimiserVariables:
                     f" optimisation objective is to minimise battery and solar costs. Therefore, this solar"
                     f" size will be ignored and the solar size will be optimised over."
                 )
-            cls.solar_size = pl.LpVariable(
+            solar_size = pl.LpVariable(
                 name="solar_capacity",
                 lowBound=0,
                 cat="Continuous",
             )
-        elif optimisation_objective == OptimisationObjectives.MINIMISE_BATTERY_CAP:
-            cls.solar_size = solar_size
-        else:
+        # When minimising the battery size, the solar size is fixed to the given value
+        elif optimisation_objective != OptimisationObjectives.MINIMISE_BATTERY_CAP:
             raise ValueError(
                 f"Unknown optimisation objective: {optimisation_objective}"
             )
-        return cls
+        return cls(
+            time_slice_variables=time_slice_variables,
+            n_time_slices=len(time_slice_names),
+            battery_capacity=battery_capacity,
+            solar_size=solar_size,
+        )
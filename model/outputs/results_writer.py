@@ -0,0 +1,89 @@
+"""File contains code associated with writing the results of a sweep of scenarios."""
+import logging
+from pathlib import Path
+from typing import Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+# Schema of the results of every scenario. The cost columns are only calculated when minimising the battery and solar
+# cost, so they are null for the other scenarios.
+RESULTS_SCHEMA = pa.schema(
+    [("scenario", pa.int64())]
+    + [
+        (name, pa.float64())
+        for name in (
+            "battery_state_of_charge",
+            "renewable_electricity_to_house",
+            "renewable_electricity_to_battery",
+            "battery_electricity_to_house",
+            "total_electricity_to_house",
+            "energy_demand",
+            "solar_generation",
+            "solar_irradiance",
+            "excess_electricity",
+            "battery_capacity",
+            "solar_size",
+            "total_cost",
+            "battery_cost",
+            "solar_cost",
+        )
+    ]
+)
+
+
+class ResultsWriter:
+    """
+    Class responsible for writing the results of many scenarios to a single parquet file. The file is opened once and
+    the results of each scenario are appended to it as they are written, with a column identifying the scenario.
+    """
+
+    def __init__(self, output_path: Path) -> None:
+        """
+        Initialises the ResultsWriter class.
+        :param output_path: Path of the parquet file to write the results to
+        """
+        self.output_path = output_path
+        self._writer: Optional[pq.ParquetWriter] = None
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, scenario: int, results: pa.Table) -> None:
+        """
+        Appends the results of a scenario to the file.
+        :param scenario: Number identifying the scenario
+        :param results: Results of the scenario for each time slice
+        """
+        if self._writer is None:
+            logger.info(f"Writing results to {self.output_path} 📝")
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._writer = pq.ParquetWriter(
+                self.output_path, RESULTS_SCHEMA, compression="zstd"
+            )
+        columns = [
+            (
+                results[field.name].cast(field.type)
+                if field.name in results.column_names
+                else pa.nulls(results.num_rows, type=field.type)
+            )
+            for field in RESULTS_SCHEMA
+            if field.name != "scenario"
+        ]
+        scenarios = pa.repeat(pa.scalar(scenario, type=pa.int64()), results.num_rows)
+        self._writer.write_table(
+            pa.Table.from_arrays([scenarios, *columns], schema=RESULTS_SCHEMA)
+        )
+
+    def close(self) -> None:
+        """
+        Closes the file, after which no more results can be written.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
@@ -1,61 +1,63 @@
 """
 Main
 """
-import gc
 import logging
-import tempfile
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Dict, List, Optional
 
-import pandas as pd
+import numpy as np
 
 from arguments import Arguments
+from model.inputs.cache import InputCache
 from model.inputs.input_loader import InputLoader
 from model.inputs.pre_processing import (
     PreProcessEnergyDemand,
     PreProcessSolarIrradiance,
 )
 from model.linear_optimiser.optimiser import Optimiser
+from model.outputs.results_writer import ResultsWriter
 
 logger = logging.getLogger(__name__)
 
 
-def run_model(args: Arguments):
+def run_model(
+    args: Arguments, plot: bool = True, input_cache: Optional[InputCache] = None
+) -> Optimiser:
     """
     Function that takes the Arguments dataclass object and runs the model.
-    :param args:
-    :return:
+    :param args: Arguments to run the model with
+    :param plot: Whether to plot the results. Plotting shows the plot, which blocks until it is closed with an
+        interactive matplotlib backend.
+    :param input_cache: Cache of the pre-processed input data, which can be shared by several runs. It should use
+        the cache directory of the arguments. If None, a new cache is used.
+    :return: Optimiser containing the solved optimisation problem
     """
     logger.info("Running model 🚀")
-    # Load the data
-    energy_demand_profile = InputLoader(pre_processor=PreProcessEnergyDemand()).read(
-        args.energy_demand_profile_path
+    # Load the data. The pre-processed energy demand only depends on its input file, and the aligned solar irradiance
+    # on both input files, so they are re-used between runs sharing the input cache, and between processes when a
+    # cache directory is given.
+    if input_cache is None:
+        input_cache = InputCache(cache_dir=args.cache_dir)
+    energy_demand_profile = input_cache.load_or_create(
+        name="energy_demand",
+        source_paths=[args.energy_demand_profile_path],
+        create=lambda: InputLoader(pre_processor=PreProcessEnergyDemand()).read(
+            args.energy_demand_profile_path
+        ),
     )
-    solar_irradiance = InputLoader(
-        pre_processor=PreProcessSolarIrradiance(
-            energy_demand_profile=energy_demand_profile
-        )
-    ).read(args.solar_irradiance_path)
-
-    # Create a temporary directory to store pre-processed data (not sure why, but when passing the dataframes directly
-    # to the optimiser, hits a recursion error. This seems to fix it).
-    logger.info("Creating temporary directory to store pre-processed data")
-    temp_dir = tempfile.mkdtemp()
-    solar_irradiance.to_csv(Path(temp_dir, "solar_irradiance.csv"), index=False)
-    energy_demand_profile.to_csv(
-        Path(temp_dir, "energy_demand_profile.csv"), index=False
+    solar_irradiance = input_cache.load_or_create(
+        name="solar_irradiance",
+        source_paths=[args.solar_irradiance_path, args.energy_demand_profile_path],
+        create=lambda: InputLoader(
+            pre_processor=PreProcessSolarIrradiance(
+                energy_demand_profile=energy_demand_profile
+            )
+        ).read(args.solar_irradiance_path),
     )
 
-    # Delete the dataframes to free up memory
-    del solar_irradiance
-    del energy_demand_profile
-    gc.collect()
-
-    # read the pre-processed data
-    energy_demand_profile = pd.read_csv(temp_dir + "/energy_demand_profile.csv")
-    solar_irradiance = pd.read_csv(temp_dir + "/solar_irradiance.csv")
-
     optimisation = Optimiser(
-        time_slices=range(len(energy_demand_profile)),
+        time_slices=np.arange(len(energy_demand_profile)),
         optimisation_objective=args.optimisation_objective,
         solar_size=args.solar_array_size,
         energy_demand=energy_demand_profile,
@@ -63,15 +65,49 @@ def run_model(args: Arguments):
         battery_capex=args.battery_capex,
         solar_capex=args.solar_capex,
     )
-    optimisation.create_optimisation_problem(
+    # The constraints are built directly as sparse matrices for HiGHS, rather than as one PuLP constraint per time
+    # slice
+    optimisation.create_optimisation_problem_sparse(
         battery_initial_capacity=args.initial_battery_capacity,
         battery_degradation_rate=args.battery_degradation_rate,
     )
     optimisation.solve()
-    optimisation.plot_results(
-        output_dir=args.output_path,
-    )
+    if plot:
+        optimisation.plot_results(
+            output_dir=args.output_path,
+        )
     if args.output_path:
         optimisation.dump_results_to_csv(
             output_path=args.output_path,
         )
+    return optimisation
+
+
+def run_batch(scenarios: List[Arguments], results_path: Optional[Path] = None) -> None:
+    """
+    Function that runs the model for each scenario in a single process, so the interpreter start up and imports are
+    only paid once, and input data shared between scenarios is only pre-processed once. The optimiser of each
+    scenario is released once its results are written, so the memory used does not grow with the number of
+    scenarios. The results are not plotted, so a sweep can run unattended.
+    :param scenarios: Arguments of each scenario to run the model with
+    :param results_path: Path of a parquet file to also write the results of every scenario to. If None, the results
+        are only written to the output path of each scenario.
+    :return: None
+    """
+    # One input cache per cache directory, so the pre-processed inputs are kept in memory for the whole batch and
+    # released with it
+    input_caches: Dict[Optional[Path], InputCache] = {}
+    with (
+        ResultsWriter(output_path=results_path)
+        if results_path is not None
+        else nullcontext()
+    ) as results_writer:
+        for number, scenario in enumerate(scenarios):
+            input_cache = input_caches.setdefault(
+                scenario.cache_dir, InputCache(cache_dir=scenario.cache_dir)
+            )
+            optimisation = run_model(scenario, plot=False, input_cache=input_cache)
+            if results_writer is not None:
+                results_writer.write(
+                    scenario=number, results=optimisation.results_table()
+                )
@@ -3,46 +3,43 @@ Main entry point for the model from the cli.
 """
 import argparse
 from pathlib import Path
+from typing import List, Optional
 
 from arguments import Arguments
 from model.constants import OptimisationObjectives
-from model.run_model import run_model
-from utils import setup_logger
 
+# Optimisation objectives that can be chosen from the command line
+_OBJECTIVES = tuple(OptimisationObjectives)
 
-class ValidateOptimisationObjective(argparse.Action):
+
+def validate_arguments(
+    arg_parser: argparse.ArgumentParser, args: argparse.Namespace
+) -> None:
     """
-    Custom action to validate the optimisation objective.
+    Validates the arguments required by the optimisation objective, exiting with an error if any are missing. This is
+    done once all the arguments are parsed, so the arguments can be given in any order.
         - If optimising battery size ensures that the solar array size is specified
         - If optimising total CAPEX ensures that the battery capex and solar capex are specified
+    :param arg_parser: Parser the arguments were parsed with
+    :param args: Parsed arguments
+    :return: None
     """
-
-    def __call__(self, parser, namespace, values, option_string=None):
-        setattr(namespace, self.dest, values)
-        if (
-            namespace.optimisation_objective
-            == OptimisationObjectives.MINIMISE_BATTERY_CAP
-        ):
-            if namespace.solar_array_size is None:
-                raise argparse.ArgumentTypeError(
-                    "Solar array size must be specified when optimising the battery size."
-                )
-        elif (
-            namespace.optimisation_objective
-            == OptimisationObjectives.MINIMISE_BATTERY_CAP
-        ):
-            if namespace.battery_capex is not None or namespace.solar_capex is not None:
-                raise argparse.ArgumentTypeError(
-                    "Battery capex and solar capex must be specified when optimising the battery "
-                    "and solar CAPEX."
-                )
-        return values
+    if args.optimisation_objective is OptimisationObjectives.MINIMISE_BATTERY_CAP:
+        if args.solar_array_size is None:
+            arg_parser.error(
+                "Solar array size must be specified when optimising the battery size."
+            )
+    elif args.battery_capex is None or args.solar_capex is None:
+        arg_parser.error(
+            "Battery capex and solar capex must be specified when optimising the battery and solar CAPEX."
+        )
 
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
     """
-    Main entry point for the model. Handles the parsing of the arguments and running the model.
-    :return:
+    Builds the parser for the model arguments. The parser can be re-used to parse the arguments of many model runs,
+    e.g. when running a sweep of scenarios in a single process.
+    :return: Argument parser
     """
     arg_parser = argparse.ArgumentParser(description="Model arguments.")
     inputs_args = arg_parser.add_argument_group(title="Inputs")
@@ -66,6 +63,12 @@ def main():
         help="Path to the output directory.",
         required=True,
     )
+    inputs_args.add_argument(
+        "--cache_dir",
+        type=Path,
+        help="Path to a directory to cache pre-processed input data in. If not specified, the input data is not "
+        "cached.",
+    )
     # Logging level
     arg_parser.add_argument(
         "--logging_level", type=str, default="INFO", help="Logging level to use."
@@ -77,7 +80,6 @@ def main():
         type=float,
         help="Size of the solar array in m^2. NOTE should only be used when optimising the battery "
         "size.",
-        action=ValidateOptimisationObjective,
     )
     optimisation_params.add_argument(
         "--initial_battery_capacity",
@@ -93,13 +95,10 @@ def main():
     )
     optimisation_params.add_argument(
         "--optimisation_objective",
-        type=str,
+        type=OptimisationObjectives,
         default=OptimisationObjectives.MINIMISE_BATTERY_CAP,
         help="Optimisation objective",
-        choices=[  # pylint: disable=unnecessary-comprehension
-            e for e in OptimisationObjectives  # pylint: disable=not-an-iterable
-        ],
-        action=ValidateOptimisationObjective,
+        choices=_OBJECTIVES,
     )
     optimisation_params.add_argument(
         "--battery_capex",
@@ -111,8 +110,25 @@ def main():
         type=float,
         help="Solar capex (£/m2)",
     )
+    return arg_parser
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for the model. Handles the parsing of the arguments and running the model.
+    :param argv: Command line arguments. If None, the arguments are read from sys.argv.
+    :return:
+    """
+    arg_parser = build_parser()
+    args = arg_parser.parse_args(argv)
+    validate_arguments(arg_parser, args)
+    # The model is only imported once the arguments are parsed, so --help and invalid arguments return without
+    # importing pandas, PuLP and scipy
+    from model.run_model import (  # pylint: disable=import-outside-toplevel
+        run_model,
+    )
+    from utils import setup_logger  # pylint: disable=import-outside-toplevel
 
-    args = arg_parser.parse_args()
     setup_logger(args.logging_level)
     args = Arguments.process_arguments(args)
     run_model(args)
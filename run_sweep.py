@@ -0,0 +1,65 @@
+"""
+Entry point for running a sweep of model scenarios from the cli. The scenarios are run in a single process, so the
+interpreter start up and imports are only paid once.
+"""
+import argparse
+import csv
+from pathlib import Path
+from typing import List, Optional
+
+from arguments import Arguments
+from model.run_model import run_batch
+from run import build_parser, validate_arguments
+from utils import setup_logger
+
+
+def read_scenarios(scenarios_path: Path) -> List[Arguments]:
+    """
+    Reads the scenarios to run from a CSV file. Each row is a scenario, and the columns are the model arguments
+    without the leading dashes (e.g. solar_irradiance_path). Empty cells use the default value of the argument.
+    :param scenarios_path: Path to the scenarios CSV file
+    :return: Arguments of each scenario
+    """
+    arg_parser = build_parser()
+    scenarios = []
+    with open(scenarios_path, newline="", encoding="utf-8") as scenarios_file:
+        for row in csv.DictReader(scenarios_file):
+            argv = []
+            for name, value in row.items():
+                if value:
+                    argv.extend([f"--{name}", value])
+            args = arg_parser.parse_args(argv)
+            validate_arguments(arg_parser, args)
+            scenarios.append(Arguments.process_arguments(args))
+    return scenarios
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Main entry point for running a sweep of scenarios.
+    :param argv: Command line arguments. If None, the arguments are read from sys.argv.
+    :return:
+    """
+    arg_parser = argparse.ArgumentParser(description="Scenario sweep arguments.")
+    arg_parser.add_argument(
+        "--scenarios_path",
+        type=Path,
+        help="Path to a CSV file with a row of model arguments for each scenario.",
+        required=True,
+    )
+    arg_parser.add_argument(
+        "--results_path",
+        type=Path,
+        help="Path of a parquet file to also write the results of every scenario to, with a column identifying the "
+        "scenario by its row number in the scenarios file.",
+    )
+    arg_parser.add_argument(
+        "--logging_level", type=str, default="INFO", help="Logging level to use."
+    )
+    args = arg_parser.parse_args(argv)
+    setup_logger(args.logging_level)
+    run_batch(read_scenarios(args.scenarios_path), results_path=args.results_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+File containing tests for caching pre-processed input data
+"""
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from model.constants import DATE_TIME, SOLAR_IRRADIANCE
+from model.inputs.cache import CACHE_VERSION, InputCache
+
+
+class TestInputCache:
+    """
+    Class containing tests for the InputCache class. The tests are:
+    - Cached data is re-used when the source files are unchanged
+    - Data is re-created when the source files change
+    - Data is re-created when the cache version changes
+    - Data is cached in memory when no cache directory is given, and changes to the returned data do not affect it
+    """
+
+    @pytest.fixture
+    def dummy_source_file(self, tmp_path: Path) -> Path:
+        """
+        Creates a dummy source file.
+        :return: Path to the dummy source file
+        """
+        source_path = Path(tmp_path, "source.csv")
+        source_path.write_text(
+            "date_time,value\n01/01/2020 00:00,1\n", encoding="utf-8"
+        )
+        return source_path
+
+    @pytest.fixture
+    def dummy_data(self) -> pd.DataFrame:
+        """
+        Creates dummy pre-processed data.
+        :return: Dummy pre-processed data
+        """
+        return pd.DataFrame(
+            {
+                DATE_TIME: pd.date_range(
+                    start="2020-01-01 00:00", end="2020-01-01 23:30", freq="30min"
+                ),
+                SOLAR_IRRADIANCE: [1.0] * 48,
+            }
+        )
+
+    def test_cached_data_is_reused(
+        self, tmp_path: Path, dummy_source_file: Path, dummy_data: pd.DataFrame
+    ) -> None:
+        """
+        The data should only be created once when the source files are unchanged, and the data cached on disk should
+        be equal to the created data.
+        :param tmp_path: Temporary directory
+        :param dummy_source_file: Dummy source file
+        :param dummy_data: Dummy pre-processed data
+        :return: None
+        """
+        # Arrange
+        cache = InputCache(cache_dir=Path(tmp_path, "cache"))
+        calls = []
+
+        def create() -> pd.DataFrame:
+            calls.append(1)
+            return dummy_data
+
+        # Act
+        created_data = cache.load_or_create("data", [dummy_source_file], create)
+        # A new cache has nothing cached in memory, so the data is read from disk
+        cached_data = InputCache(cache_dir=Path(tmp_path, "cache")).load_or_create(
+            "data", [dummy_source_file], create
+        )
+
+        # Assert
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(created_data, cached_data)
+
+    def test_data_is_recreated_when_source_changes(
+        self, tmp_path: Path, dummy_source_file: Path, dummy_data: pd.DataFrame
+    ) -> None:
+        """
+        The data should be re-created when the contents of a source file change.
+        :param tmp_path: Temporary directory
+        :param dummy_source_file: Dummy source file
+        :param dummy_data: Dummy pre-processed data
+        :return: None
+        """
+        # Arrange
+        cache = InputCache(cache_dir=Path(tmp_path, "cache"))
+        calls = []
+
+        def create() -> pd.DataFrame:
+            calls.append(1)
+            return dummy_data
+
+        # Act
+        cache.load_or_create("data", [dummy_source_file], create)
+        dummy_source_file.write_text(
+            "date_time,value\n01/01/2020 00:00,2\n", encoding="utf-8"
+        )
+        cache.load_or_create("data", [dummy_source_file], create)
+
+        # Assert
+        assert len(calls) == 2
+
+    def test_data_is_recreated_when_cache_version_changes(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        dummy_source_file: Path,
+        dummy_data: pd.DataFrame,
+    ) -> None:
+        """
+        The data cached on disk should not be loaded after the cache version changes, as it may have been
+        pre-processed differently.
+        :param monkeypatch: Pytest monkeypatch fixture
+        :param tmp_path: Temporary directory
+        :param dummy_source_file: Dummy source file
+        :param dummy_data: Dummy pre-processed data
+        :return: None
+        """
+        # Arrange
+        calls = []
+
+        def create() -> pd.DataFrame:
+            calls.append(1)
+            return dummy_data
+
+        # Act
+        InputCache(cache_dir=Path(tmp_path, "cache")).load_or_create(
+            "data", [dummy_source_file], create
+        )
+        monkeypatch.setattr("model.inputs.cache.CACHE_VERSION", CACHE_VERSION + 1)
+        InputCache(cache_dir=Path(tmp_path, "cache")).load_or_create(
+            "data", [dummy_source_file], create
+        )
+
+        # Assert
+        assert len(calls) == 2
+
+    def test_data_is_cached_in_memory(
+        self, dummy_source_file: Path, dummy_data: pd.DataFrame
+    ) -> None:
+        """
+        Without a cache directory the data should only be created once in the same process, and changing the
+        returned data should not change the cached data.
+        :param dummy_source_file: Dummy source file
+        :param dummy_data: Dummy pre-processed data
+        :return: None
+        """
+        # Arrange
+        cache = InputCache()
+        calls = []
+
+        def create() -> pd.DataFrame:
+            calls.append(1)
+            return dummy_data.copy()
+
+        # Act
+        created_data = cache.load_or_create("in_memory", [dummy_source_file], create)
+        created_data[SOLAR_IRRADIANCE] = 0.0
+        cached_data = cache.load_or_create("in_memory", [dummy_source_file], create)
+
+        # Assert
+        assert len(calls) == 1
+        pd.testing.assert_frame_equal(cached_data, dummy_data)
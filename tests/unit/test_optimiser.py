@@ -1,12 +1,32 @@
 """
 File containing tests for the optimiser
 """
+import numpy as np
 import pandas as pd
 import pulp as pl
 import pytest
 
 from model.constants import ENERGY_DEMAND, SOLAR_IRRADIANCE, OptimisationObjectives
 from model.linear_optimiser.optimiser import Optimiser
+from model.linear_optimiser.sparse_problem import SparseProblem
+
+
+class WarmStartRecordingSolver(pl.PULP_CBC_CMD):
+    """
+    CBC solver that records whether each solve is warm started.
+    """
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.warm_starts = []
+
+    def actualSolve(self, lp, **kwargs):
+        # pylint: disable=invalid-name,arguments-differ
+        """
+        Records whether the solve is warm started, then solves the problem with CBC.
+        """
+        self.warm_starts.append(self.optionsDict.get("warmStart", False))
+        return super().actualSolve(lp, **kwargs)
 
 
 class TestOptimiser:
@@ -100,3 +120,242 @@ class TestOptimiser:
         # Assert
         assert isinstance(dummy_optimiser_min_cost.variables.solar_size, pl.LpVariable)
         assert dummy_optimiser_min_cost.problem is not None
+
+    def test_optimiser_solves_with_given_solver(self) -> None:
+        """
+        Test the optimiser uses the solver it is given and that this solver finds an optimal solution.
+        """
+        # Arrange
+        solver = pl.PULP_CBC_CMD(msg=False)
+        optimiser = Optimiser(
+            time_slices=range(10),
+            optimisation_objective=OptimisationObjectives.MINIMISE_BATTERY_CAP,
+            solar_size=10,
+            energy_demand=pd.DataFrame({ENERGY_DEMAND: [1] * 10}),
+            solar_irradiance=pd.DataFrame({SOLAR_IRRADIANCE: [1000] * 10}),
+            solver=solver,
+        )
+        optimiser.create_optimisation_problem(
+            battery_initial_capacity=0,
+            battery_degradation_rate=0.01,
+            solar_efficiency=0.2,
+        )
+        # Act
+        optimiser.solve()
+        # Assert
+        assert optimiser.solver is solver
+        assert pl.LpStatus[optimiser.problem.status] == "Optimal"
+
+    def test_optimiser_warm_starts_repeated_solves(self) -> None:
+        """
+        Test that re-solving the optimisation problem with the same variables warm starts the solver from the previous
+        solution, and that an optimal solution is still found. The solver that was given should not be changed, so
+        it is not warm started when used for other problems.
+        """
+        # Arrange
+        solver = WarmStartRecordingSolver(msg=False)
+        optimiser = Optimiser(
+            time_slices=range(10),
+            optimisation_objective=OptimisationObjectives.MINIMISE_BATTERY_CAP,
+            solar_size=10,
+            energy_demand=pd.DataFrame({ENERGY_DEMAND: [1] * 10}),
+            solar_irradiance=pd.DataFrame({SOLAR_IRRADIANCE: [1000] * 10}),
+            solver=solver,
+        )
+        optimiser.create_optimisation_problem(
+            battery_initial_capacity=0,
+            battery_degradation_rate=0.01,
+            solar_efficiency=0.2,
+        )
+        optimiser.solve()
+        # Act
+        optimiser.create_optimisation_problem(
+            battery_initial_capacity=0,
+            battery_degradation_rate=0.02,
+            solar_efficiency=0.2,
+        )
+        optimiser.solve()
+        # Assert
+        assert solver.warm_starts == [False, True]
+        assert not solver.optionsDict.get("warmStart", False)
+        assert pl.LpStatus[optimiser.problem.status] == "Optimal"
+
+    @pytest.mark.parametrize(
+        "optimisation_objective",
+        [
+            OptimisationObjectives.MINIMISE_BATTERY_CAP,
+            OptimisationObjectives.MINIMISE_BATTERY_AND_SOLAR_COST,
+        ],
+    )
+    @pytest.mark.parametrize(
+        "sparse, use_cbc",
+        [(False, True), (False, False), (True, False)],
+        ids=["pulp_cbc", "pulp_no_solver", "sparse"],
+    )
+    def test_solve_routes_give_same_solution(
+        self,
+        optimisation_objective: OptimisationObjectives,
+        sparse: bool,
+        use_cbc: bool,
+    ) -> None:
+        """
+        Test that each route for building and solving the optimisation problem gives the same optimal solution as
+        building it with PuLP expressions and solving it with CBC. The routes are:
+        - PuLP expressions solved with CBC
+        - PuLP expressions solved without a solver, which passes the problem straight to HiGHS in matrix form
+        - Sparse matrices, which are always solved with HiGHS
+        :param optimisation_objective: Optimisation objective
+        :param sparse: Whether the problem is built as sparse matrices
+        :param use_cbc: Whether the optimiser is given the CBC solver
+        """
+        # Arrange
+        objectives = []
+        for route_sparse, route_use_cbc in ((False, True), (sparse, use_cbc)):
+            optimiser = Optimiser(
+                time_slices=range(10),
+                optimisation_objective=optimisation_objective,
+                solar_size=10,
+                solar_capex=100,
+                battery_capex=100,
+                energy_demand=np.ones(10),
+                solar_irradiance=np.tile([0.0, 3000.0], 5),
+                solver=pl.PULP_CBC_CMD(msg=False) if route_use_cbc else None,
+            )
+            create_optimisation_problem = (
+                optimiser.create_optimisation_problem_sparse
+                if route_sparse
+                else optimiser.create_optimisation_problem
+            )
+            create_optimisation_problem(
+                battery_initial_capacity=0,
+                battery_degradation_rate=0.01,
+                solar_efficiency=0.2,
+            )
+            # Act
+            optimiser.solve()
+            objectives.append(pl.value(optimiser.problem.objective))
+            # Assert
+            assert pl.LpStatus[optimiser.problem.status] == "Optimal"
+        assert objectives[1] == pytest.approx(objectives[0], rel=1e-6)
+
+    def test_optimiser_accepts_arrays(self) -> None:
+        """
+        Test that the energy demand and solar irradiance profiles can be given as arrays, and that they are stored in
+        the same way as when they are given as dataframes.
+        """
+        # Arrange
+        energy_demand = np.ones(10)
+        solar_irradiance = np.full(10, 1000.0)
+        # Act
+        optimiser = Optimiser(
+            time_slices=range(10),
+            optimisation_objective=OptimisationObjectives.MINIMISE_BATTERY_CAP,
+            solar_size=10,
+            energy_demand=energy_demand,
+            solar_irradiance=solar_irradiance,
+            solver=pl.PULP_CBC_CMD(msg=False),
+        )
+        optimiser_from_dataframes = Optimiser(
+            time_slices=range(10),
+            optimisation_objective=OptimisationObjectives.MINIMISE_BATTERY_CAP,
+            solar_size=10,
+            energy_demand=pd.DataFrame({ENERGY_DEMAND: energy_demand}),
+            solar_irradiance=pd.DataFrame({SOLAR_IRRADIANCE: solar_irradiance}),
+            solver=pl.PULP_CBC_CMD(msg=False),
+        )
+        # Assert
+        np.testing.assert_array_equal(
+            optimiser.energy_demand, optimiser_from_dataframes.energy_demand
+        )
+        np.testing.assert_array_equal(
+            optimiser.solar_irradiance, optimiser_from_dataframes.solar_irradiance
+        )
+
+    @pytest.mark.parametrize("n_time_slices", [0, 10])
+    def test_sparse_problem_with_fewer_time_slices_than_profiles(
+        self, n_time_slices: int
+    ) -> None:
+        """
+        Test that building the optimisation problem as sparse matrices only uses the profile values of the time slices
+        being optimised over, and gives the same optimal solution as building it with PuLP expressions. This includes
+        the case of no time slices at all.
+        :param n_time_slices: Number of time slices to optimise over
+        """
+        # Arrange
+        objectives = []
+        for sparse in (False, True):
+            optimiser = Optimiser(
+                time_slices=range(n_time_slices),
+                optimisation_objective=OptimisationObjectives.MINIMISE_BATTERY_CAP,
+                solar_size=10,
+                energy_demand=np.ones(20),
+                solar_irradiance=np.tile([0.0, 3000.0], 10),
+                solver=pl.PULP_CBC_CMD(msg=False),
+            )
+            create_optimisation_problem = (
+                optimiser.create_optimisation_problem_sparse
+                if sparse
+                else optimiser.create_optimisation_problem
+            )
+            create_optimisation_problem(
+                battery_initial_capacity=0,
+                battery_degradation_rate=0.01,
+                solar_efficiency=0.2,
+            )
+            # Act
+            optimiser.solve()
+            objectives.append(pl.value(optimiser.problem.objective))
+            # Assert
+            assert pl.LpStatus[optimiser.problem.status] == "Optimal"
+        assert objectives[1] == pytest.approx(objectives[0], rel=1e-6)
+
+    @pytest.mark.parametrize("sparse", [False, True], ids=["pulp_no_solver", "sparse"])
+    def test_linprog_solves_are_not_stored_for_warm_starting(
+        self, sparse: bool
+    ) -> None:
+        """
+        Test that problems solved with linprog, which cannot be warm started, do not store their solution for warm
+        starting.
+        :param sparse: Whether the problem is built as sparse matrices
+        """
+        # Arrange
+        optimiser = Optimiser(
+            time_slices=range(10),
+            optimisation_objective=OptimisationObjectives.MINIMISE_BATTERY_CAP,
+            solar_size=10,
+            energy_demand=np.ones(10),
+            solar_irradiance=np.tile([0.0, 3000.0], 5),
+        )
+        create_optimisation_problem = (
+            optimiser.create_optimisation_problem_sparse
+            if sparse
+            else optimiser.create_optimisation_problem
+        )
+        create_optimisation_problem(
+            battery_initial_capacity=0,
+            battery_degradation_rate=0.01,
+            solar_efficiency=0.2,
+        )
+        # Act
+        optimiser.solve()
+        # Assert
+        assert pl.LpStatus[optimiser.problem.status] == "Optimal"
+        assert optimiser._warm_start_values is None  # pylint: disable=protected-access
+
+    def test_sparse_problem_without_solution_clears_values(self) -> None:
+        """
+        Test that solving a sparse problem that has no solution clears the values of its variables, rather than leaving
+        the values of an earlier solve.
+        """
+        # Arrange
+        problem = pl.LpProblem("infeasible", pl.LpMinimize)
+        variable = pl.LpVariable("x", lowBound=0)
+        problem += variable
+        problem += variable >= 1
+        SparseProblem.from_lp_problem(problem).solve()
+        problem += variable <= 0.5
+        # Act
+        status = SparseProblem.from_lp_problem(problem).solve()
+        # Assert
+        assert pl.LpStatus[status] == "Infeasible"
+        assert variable.varValue is None
@@ -1,7 +1,6 @@
 """
 This file contains tests for the optimiser_variables module.
 """
-
 import pytest
 
 from model.constants import OptimisationObjectives
@@ -34,3 +33,31 @@ class TestOptimiserVariables:
         assert len(optimiser_variables.battery_electricity_to_house) == 10
         assert len(optimiser_variables.battery_state_of_charge) == 10
         assert optimiser_variables.solar_size == 10
+
+    def test_variables_are_not_shared(
+        self, optimiser_variables: OptimiserVariables
+    ) -> None:
+        """
+        Tests that creating a new set of variables does not change previously created variables.
+        """
+        new_optimiser_variables = OptimiserVariables.create_variables(
+            time_slices=range(5),
+            optimisation_objective=OptimisationObjectives.MINIMISE_BATTERY_AND_SOLAR_COST,
+        )
+        assert len(optimiser_variables.battery_state_of_charge) == 10
+        assert optimiser_variables.solar_size == 10
+        assert len(new_optimiser_variables.battery_state_of_charge) == 5
+
+    def test_time_slice_variables_layout(
+        self, optimiser_variables: OptimiserVariables
+    ) -> None:
+        """
+        Tests that the variables of each time slice are stored in a single list, ordered by variable and then by time
+        slice.
+        """
+        assert len(optimiser_variables.time_slice_variables) == 40
+        assert (
+            optimiser_variables.battery_electricity_to_house[3]
+            is optimiser_variables.time_slice_variables[23]
+        )
+        assert optimiser_variables.battery_state_of_charge[9].name == "soc_9"
@@ -1,6 +1,8 @@
 """
 File containing tests for pre-processing the energy demand data
 """
+from typing import List, Tuple
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -8,98 +10,90 @@ import pytest
 from model.constants import DATE_TIME, ENERGY_DEMAND
 from model.inputs.pre_processing import PreProcessEnergyDemand
 
+# Seeded random number generator, so the dummy data is the same on every run
+RNG = np.random.default_rng(0)
+
+# Timestamps used in the assertions
+MIDNIGHT = pd.Timestamp("2014-05-10 00:00")
+HALF_PAST_MIDNIGHT = pd.Timestamp("2014-05-10 00:30")
+ONE_AM = pd.Timestamp("2014-05-10 01:00")
+HALF_PAST_ONE_AM = pd.Timestamp("2014-05-10 01:30")
+LAST_HALF_HOUR = pd.Timestamp("2016-09-01 23:30")
+
 
 class TestPreProcessingEnergyDemand:
     """
     Class containing tests for pre-processing the energy demand data. The tests are:
     - Filtering out non-half-hourly data
     - Removing duplicate timestamps by
-        - If the values are the same then just take the first value
-        - If the values are different then take the average of the values
+        - Taking the average of the values of duplicate timestamps, for both the same and different values
     """
 
-    @pytest.fixture(scope="class")
+    @pytest.fixture(scope="session")
     def dummy_energy_demand_data_non_hh_timestamp(self) -> pd.DataFrame:
         """
         Creates dummy energy demand data with some values that are not on the half hour.
         """
-        df = pd.DataFrame(
-            {
-                DATE_TIME: pd.date_range(
-                    start="2014-05-10 00:00", end="2016-09-01 23:30", freq="30min"
-                ),
-                ENERGY_DEMAND: np.random.uniform(low=0, high=1, size=40608),
-            }
-        )
+        date_time = pd.date_range(
+            start="2014-05-10 00:00", end="2016-09-01 23:30", freq="30min"
+        ).to_numpy(copy=True)
         # Add some data points that are not on the half hour
-        df.loc[0, DATE_TIME] = pd.to_datetime("2014-05-10 00:15")
-        df.loc[1, DATE_TIME] = pd.to_datetime("2014-05-10 00:45")
-
-        return df
+        date_time[0] = np.datetime64("2014-05-10T00:15")
+        date_time[1] = np.datetime64("2014-05-10T00:45")
 
-    @pytest.fixture(scope="class")
-    def dummy_energy_demand_data_duplicate_timestamps_same_values(self) -> pd.DataFrame:
-        """
-        Creates dummy energy demand data with duplicate timestamps and the same values.
-        """
-        df = pd.DataFrame(
+        return pd.DataFrame(
             {
-                DATE_TIME: pd.date_range(
-                    start="2014-05-10 00:00",
-                    end="2014-05-10 23:30",
-                    freq="30min",
-                ),
-                ENERGY_DEMAND: np.ones(48),
-            }
-        )
-        # Add some duplicate timestamps
-        duplicate_timestamps = pd.DataFrame(
-            {
-                DATE_TIME: pd.date_range(
-                    start="2014-05-10 00:00",
-                    end="2014-05-10 01:00",
-                    freq="30min",
-                ),
-                ENERGY_DEMAND: [1, 1, 1],
+                DATE_TIME: date_time,
+                ENERGY_DEMAND: RNG.random(40608),
             }
         )
-        df = pd.concat([df, duplicate_timestamps])
-        return df
 
-    @pytest.fixture(scope="class")
-    def dummy_energy_demand_data_duplicate_timestamps_diff_values(self) -> pd.DataFrame:
+    @pytest.fixture(
+        scope="session",
+        params=[([1, 1, 1], [1, 1, 1]), ([2, 3, 4], [1.5, 2, 2.5])],
+        ids=["same_values", "diff_values"],
+    )
+    def dummy_energy_demand_data_duplicate_timestamps(
+        self, request
+    ) -> Tuple[pd.DataFrame, List[float]]:
         """
-        Creates dummy energy demand data with duplicate timestamps and different.
+        Creates dummy energy demand data with duplicate timestamps, either with the same or different values to the
+        original timestamps.
+        :return: Dummy energy demand data, and the expected energy demand at midnight, half past midnight and 1am
         """
-        df = pd.DataFrame(
+        duplicate_values, expected_values = request.param
+        # Add some duplicate timestamps to the end of a day of data
+        data = pd.DataFrame(
             {
-                DATE_TIME: pd.date_range(
-                    start="2014-05-10 00:00",
-                    end="2014-05-10 23:30",
-                    freq="30min",
+                DATE_TIME: np.concatenate(
+                    [
+                        pd.date_range(
+                            start="2014-05-10 00:00",
+                            end="2014-05-10 23:30",
+                            freq="30min",
+                        ).to_numpy(),
+                        pd.date_range(
+                            start="2014-05-10 00:00",
+                            end="2014-05-10 01:00",
+                            freq="30min",
+                        ).to_numpy(),
+                    ]
                 ),
-                ENERGY_DEMAND: np.ones(48),
-            }
-        )
-        # Add some duplicate timestamps
-        duplicate_timestamps = pd.DataFrame(
-            {
-                DATE_TIME: pd.date_range(
-                    start="2014-05-10 00:00",
-                    end="2014-05-10 01:00",
-                    freq="30min",
+                ENERGY_DEMAND: np.concatenate(
+                    [
+                        np.ones(48),
+                        np.array(duplicate_values, dtype=np.float64),
+                    ]
                 ),
-                ENERGY_DEMAND: [2, 3, 4],
             }
         )
-        df = pd.concat([df, duplicate_timestamps])
-        return df
+        return data, expected_values
 
     def test_filtering_non_half_hourly_data(
         self, dummy_energy_demand_data_non_hh_timestamp
     ) -> None:
         """
-        The FilterNonHalfHourlyData class should filter out any data points that are not on the half hour.
+        The PreProcessEnergyDemand class should filter out any data points that are not on the half hour.
 
         The two data points that are not on the half hour should be removed.
         :param dummy_energy_demand_data: Dummy energy demand data
@@ -112,85 +106,51 @@ class TestPreProcessingEnergyDemand:
         )
         # Assert
         assert len(filtered_data) == 40606
-        assert filtered_data[DATE_TIME].iloc[0] == pd.to_datetime("2014-05-10 01:00")
-        assert filtered_data[DATE_TIME].iloc[1] == pd.to_datetime("2014-05-10 01:30")
-        assert filtered_data[DATE_TIME].iloc[-1] == pd.to_datetime("2016-09-01 23:30")
+        assert filtered_data[DATE_TIME].iat[0] == ONE_AM
+        assert filtered_data[DATE_TIME].iat[1] == HALF_PAST_ONE_AM
+        assert filtered_data[DATE_TIME].iat[-1] == LAST_HALF_HOUR
+        assert filtered_data.index.equals(pd.RangeIndex(len(filtered_data)))
 
-    def test_removing_duplicate_timestamps_same_values(
-        self, dummy_energy_demand_data_duplicate_timestamps_same_values
+    def test_removing_duplicate_timestamps(
+        self, dummy_energy_demand_data_duplicate_timestamps
     ) -> None:
         """
-        The RemoveDuplicateTimestamps class should remove duplicate timestamps where the values are the same.
+        The PreProcessEnergyDemand class should take the average of the values of duplicate timestamps. Where the
+        values are the same this is just the value.
 
         The duplicate timestamps should be removed.
-        :param dummy_energy_demand_data_duplicate_timestamps_same_values: Dummy energy demand data
+        :param dummy_energy_demand_data_duplicate_timestamps: Dummy energy demand data and expected values
         :return: None
         """
         # Arrange
+        data, expected_values = dummy_energy_demand_data_duplicate_timestamps
         # Act
-        filtered_data = PreProcessEnergyDemand().pre_process(
-            dummy_energy_demand_data_duplicate_timestamps_same_values
-        )
+        filtered_data = PreProcessEnergyDemand().pre_process(data)
+        energy_demand = filtered_data.set_index(DATE_TIME)
         # Assert
         assert len(filtered_data) == 48
-        assert (
-            filtered_data.loc[
-                filtered_data[DATE_TIME] == pd.to_datetime("2014-05-10 00:00"),
-                ENERGY_DEMAND,
-            ].iloc[0]
-            == 1
-        )
-        assert (
-            filtered_data.loc[
-                filtered_data[DATE_TIME] == pd.to_datetime("2014-05-10 00:30"),
-                ENERGY_DEMAND,
-            ].iloc[0]
-            == 1
-        )
-        assert (
-            filtered_data.loc[
-                filtered_data[DATE_TIME] == pd.to_datetime("2014-05-10 01:00"),
-                ENERGY_DEMAND,
-            ].iloc[0]
-            == 1
-        )
+        assert energy_demand.at[MIDNIGHT, ENERGY_DEMAND] == expected_values[0]
+        assert energy_demand.at[HALF_PAST_MIDNIGHT, ENERGY_DEMAND] == expected_values[1]
+        assert energy_demand.at[ONE_AM, ENERGY_DEMAND] == expected_values[2]
 
-    def test_removing_duplicate_timestamps_diff_values(
-        self, dummy_energy_demand_data_duplicate_timestamps_diff_values
-    ) -> None:
+    def test_energy_demand_values_unchanged(self) -> None:
         """
-        The RemoveDuplicateTimestamps class should calculate the average duplicate timestamps where the values are the
-        different.
-
-        The duplicate timestamps should be removed.
-        :param dummy_energy_demand_data_duplicate_timestamps_diff_values: Dummy energy demand data
+        The PreProcessEnergyDemand class should keep the energy demand values exactly as they are given, as float64,
+        without changing the dtype of the data it is given.
         :return: None
         """
         # Arrange
-        # Act
-        filtered_data = PreProcessEnergyDemand().pre_process(
-            dummy_energy_demand_data_duplicate_timestamps_diff_values
+        data = pd.DataFrame(
+            {
+                DATE_TIME: pd.date_range(
+                    start="2014-05-10 00:00", end="2014-05-10 23:30", freq="30min"
+                ),
+                ENERGY_DEMAND: np.full(48, 0.637),
+            }
         )
+        # Act
+        filtered_data = PreProcessEnergyDemand().pre_process(data)
         # Assert
-        assert len(filtered_data) == 48
-        assert (
-            filtered_data.loc[
-                filtered_data[DATE_TIME] == pd.to_datetime("2014-05-10 00:00"),
-                ENERGY_DEMAND,
-            ].iloc[0]
-            == 1.5
-        )
-        assert (
-            filtered_data.loc[
-                filtered_data[DATE_TIME] == pd.to_datetime("2014-05-10 00:30"),
-                ENERGY_DEMAND,
-            ].iloc[0]
-            == 2
-        )
-        assert (
-            filtered_data.loc[
-                filtered_data[DATE_TIME] == pd.to_datetime("2014-05-10 01:00"),
-                ENERGY_DEMAND,
-            ].iloc[0]
-            == 2.5
-        )
+        assert filtered_data[ENERGY_DEMAND].dtype == np.float64
+        assert data[ENERGY_DEMAND].dtype == np.float64
+        np.testing.assert_array_equal(filtered_data[ENERGY_DEMAND], 0.637)
@@ -1,6 +1,6 @@
 """
 This file contains tests associated with adjusting the solar irradiance timestamps. As seen in the
-MatchTimeStampsPreProcessor class.
+PreProcessSolarIrradiance class.
 """
 import numpy as np
 import pandas as pd
@@ -9,6 +9,9 @@ import pytest
 from model.constants import DATE_TIME, ENERGY_DEMAND, SOLAR_IRRADIANCE
 from model.inputs.pre_processing import PreProcessSolarIrradiance
 
+# Seeded random number generator, so the dummy data is the same on every run
+RNG = np.random.default_rng(0)
+
 
 class TestAdjustingSolarIrradianceTimestamp:
     """
@@ -18,9 +21,10 @@ class TestAdjustingSolarIrradianceTimestamp:
     - Testing that the solar irradiance successfully gets converted from hourly to half-hourly.
     - Testing that the solar irradiance timestamps are adjusted correctly to match the timestamps of the energy demand
     data.
+    - Testing that solar irradiance data for more than one year is matched using the first year.
     """
 
-    @pytest.fixture(scope="class")
+    @pytest.fixture(scope="session")
     def dummy_solar_irradiance_data(self) -> pd.DataFrame:
         """
         Creates dummy solar irradiance data.
@@ -31,11 +35,11 @@ class TestAdjustingSolarIrradianceTimestamp:
                 DATE_TIME: pd.date_range(
                     start="2020-01-01 00:00", end="2020-12-31 23:00", freq="H"
                 ),
-                SOLAR_IRRADIANCE: np.random.uniform(low=0, high=1, size=8784),
+                SOLAR_IRRADIANCE: RNG.random(8784),
             }
         )
 
-    @pytest.fixture(scope="class")
+    @pytest.fixture(scope="session")
     def dummy_energy_demand_data(self) -> pd.DataFrame:
         """
         Creates dummy energy demand data.
@@ -46,7 +50,7 @@ class TestAdjustingSolarIrradianceTimestamp:
                 DATE_TIME: pd.date_range(
                     start="2014-05-10 00:00", end="2016-09-01 23:30", freq="30min"
                 ),
-                ENERGY_DEMAND: np.random.uniform(low=0, high=1, size=40608),
+                ENERGY_DEMAND: RNG.random(40608),
             }
         )
 
@@ -69,7 +73,7 @@ class TestAdjustingSolarIrradianceTimestamp:
 
         # Act
         adjusted_solar_irradiance_data = match_time_stamps_pre_processor.pre_process(
-            dummy_solar_irradiance_data
+            dummy_solar_irradiance_data.copy()
         )
 
         # Assert
@@ -77,3 +81,111 @@ class TestAdjustingSolarIrradianceTimestamp:
             adjusted_solar_irradiance_data[DATE_TIME],
             dummy_energy_demand_data[DATE_TIME],
         )
+
+    def test_solar_irradiance_matched_at_same_time_of_year(
+        self,
+        dummy_solar_irradiance_data: pd.DataFrame,
+        dummy_energy_demand_data: pd.DataFrame,
+    ) -> None:
+        """
+        Tests that the solar irradiance of each energy demand timestamp is taken from the same time of year in the
+        solar irradiance data, for every year of the energy demand data.
+        :param dummy_solar_irradiance_data: Dummy solar irradiance data
+        :param dummy_energy_demand_data: Dummy energy demand data
+        :return: None
+        """
+        # Arrange
+        match_time_stamps_pre_processor = PreProcessSolarIrradiance(
+            dummy_energy_demand_data
+        )
+        solar_irradiance = dummy_solar_irradiance_data.set_index(DATE_TIME)[
+            SOLAR_IRRADIANCE
+        ]
+
+        # Act
+        adjusted_solar_irradiance_data = match_time_stamps_pre_processor.pre_process(
+            dummy_solar_irradiance_data.copy()
+        ).set_index(DATE_TIME)[SOLAR_IRRADIANCE]
+
+        # Assert
+        for year in (2014, 2015, 2016):
+            assert adjusted_solar_irradiance_data[
+                pd.Timestamp(f"{year}-06-01 12:00")
+            ] == pytest.approx(solar_irradiance[pd.Timestamp("2020-06-01 12:00")])
+
+    def test_zero_values_filled_from_previous_day(self) -> None:
+        """
+        Tests that zero solar irradiance values are replaced with the value of the previous day at the same time,
+        and that missing values are kept and carried forward to zero values on the following days.
+        :return: None
+        """
+        # Arrange
+        solar_irradiance = pd.DataFrame(
+            {
+                DATE_TIME: pd.to_datetime(
+                    [
+                        "2020-01-01 12:00",
+                        "2020-01-02 12:00",
+                        "2020-01-03 12:00",
+                        "2020-01-04 12:00",
+                        "2020-01-05 12:00",
+                        "2020-01-06 12:00",
+                    ]
+                ),
+                SOLAR_IRRADIANCE: [5.0, 0.0, 0.0, np.nan, 0.0, 3.0],
+            }
+        )
+
+        # Act
+        filled_solar_irradiance = PreProcessSolarIrradiance.fill_in_zero_values(
+            solar_irradiance
+        )
+
+        # Assert
+        np.testing.assert_array_equal(
+            filled_solar_irradiance[SOLAR_IRRADIANCE].to_numpy(),
+            [5.0, 5.0, 5.0, np.nan, np.nan, 3.0],
+        )
+
+    def test_solar_irradiance_for_two_years(
+        self, dummy_energy_demand_data: pd.DataFrame
+    ) -> None:
+        """
+        Tests that solar irradiance data covering two years, which has each time of year twice, is matched to the
+        energy demand data using the first year.
+        :param dummy_energy_demand_data: Dummy energy demand data
+        :return: None
+        """
+        # Arrange
+        timestamps = pd.date_range(
+            start="2019-01-01 00:00", end="2020-12-31 23:00", freq="H"
+        )
+        solar_irradiance = pd.DataFrame(
+            {
+                DATE_TIME: timestamps,
+                SOLAR_IRRADIANCE: np.where(timestamps < "2020-01-01", 1.0, 2.0),
+            }
+        )
+        match_time_stamps_pre_processor = PreProcessSolarIrradiance(
+            dummy_energy_demand_data
+        )
+
+        # Act
+        adjusted_solar_irradiance_data = match_time_stamps_pre_processor.pre_process(
+            solar_irradiance
+        ).set_index(DATE_TIME)[SOLAR_IRRADIANCE]
+
+        # Assert
+        pd.testing.assert_index_equal(
+            adjusted_solar_irradiance_data.index,
+            pd.DatetimeIndex(dummy_energy_demand_data[DATE_TIME]),
+            check_names=False,
+        )
+        # The 29th of February is only in the second year. Only the hourly values are checked, as each half hourly
+        # value is back filled from the next hour, which is in the second year for the last half hour of the first year.
+        hourly = adjusted_solar_irradiance_data[
+            adjusted_solar_irradiance_data.index.minute == 0
+        ]
+        is_leap_day = (hourly.index.month == 2) & (hourly.index.day == 29)
+        assert (hourly[~is_leap_day] == 1.0).all()
+        assert (hourly[is_leap_day] == 2.0).all()
@@ -0,0 +1,61 @@
+"""
+File containing tests for writing the results of a sweep of scenarios
+"""
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from model.outputs.results_writer import RESULTS_SCHEMA, ResultsWriter
+
+
+class TestResultsWriter:
+    """
+    Class containing tests for the ResultsWriter class. The tests are:
+    - The results of every scenario are written to a single file, with the columns missing from a scenario left null
+    - No file is written if there are no results
+    """
+
+    def test_results_of_scenarios_are_appended(self, tmp_path: Path) -> None:
+        """
+        The results of each scenario should be appended to the same file and identified by the scenario column. The
+        cost columns should be null for scenarios that do not calculate them.
+        :param tmp_path: Temporary directory
+        :return: None
+        """
+        # Arrange
+        output_path = Path(tmp_path, "results", "results.parquet")
+        battery_cap_results = pa.table(
+            {"battery_capacity": [1.0, 1.0], "energy_demand": [0.5, 0.25]}
+        )
+        cost_results = pa.table(
+            {"battery_capacity": [2.0], "energy_demand": [0.75], "total_cost": [10.0]}
+        )
+
+        # Act
+        with ResultsWriter(output_path=output_path) as results_writer:
+            results_writer.write(scenario=0, results=battery_cap_results)
+            results_writer.write(scenario=1, results=cost_results)
+        results = pd.read_parquet(output_path)
+
+        # Assert
+        assert list(results.columns) == RESULTS_SCHEMA.names
+        assert results["scenario"].tolist() == [0, 0, 1]
+        assert results["battery_capacity"].tolist() == [1.0, 1.0, 2.0]
+        assert results["total_cost"].isna().tolist() == [True, True, False]
+
+    def test_no_file_is_written_without_results(self, tmp_path: Path) -> None:
+        """
+        The file should only be created once the results of a scenario are written.
+        :param tmp_path: Temporary directory
+        :return: None
+        """
+        # Arrange
+        output_path = Path(tmp_path, "results.parquet")
+
+        # Act
+        with ResultsWriter(output_path=output_path):
+            pass
+
+        # Assert
+        assert not output_path.exists()
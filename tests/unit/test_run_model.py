@@ -0,0 +1,114 @@
+"""
+File containing tests for running the model
+"""
+from pathlib import Path
+from typing import List
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from arguments import Arguments
+from model.constants import DATE_TIME, DATE_TIME_FORMAT, ENERGY_DEMAND, SOLAR_IRRADIANCE
+from model.run_model import run_batch, run_model
+
+
+class TestRunBatch:
+    """
+    Class containing tests for the run_batch function. The tests are:
+    - The results of each scenario are written to the results file, and are the same as running the scenario on its
+    own
+    - Without a results file, the results of each scenario are written to its output path, and nothing is plotted
+    """
+
+    @pytest.fixture
+    def dummy_scenarios(self, tmp_path: Path) -> List[Arguments]:
+        """
+        Creates dummy input files for a day, and two scenarios with different solar array sizes that use them.
+        :param tmp_path: Temporary directory
+        :return: Dummy scenarios
+        """
+        solar_irradiance_path = Path(tmp_path, "solar_irradiance.csv")
+        pd.DataFrame(
+            {
+                DATE_TIME: pd.date_range(
+                    start="2020-06-01 00:00", end="2020-06-01 23:00", freq="H"
+                ).strftime(DATE_TIME_FORMAT),
+                SOLAR_IRRADIANCE: [0.0] * 6 + [812.3] * 12 + [0.0] * 6,
+            }
+        ).to_csv(solar_irradiance_path, index=False)
+        energy_demand_profile_path = Path(tmp_path, "energy_demand.csv")
+        pd.DataFrame(
+            {
+                DATE_TIME: pd.date_range(
+                    start="2014-06-01 00:00", end="2014-06-01 23:30", freq="30min"
+                ).strftime(DATE_TIME_FORMAT),
+                ENERGY_DEMAND: [0.637] * 48,
+            }
+        ).to_csv(energy_demand_profile_path, index=False)
+        return [
+            Arguments(
+                solar_irradiance_path=solar_irradiance_path,
+                energy_demand_profile_path=energy_demand_profile_path,
+                output_path=Path(tmp_path, f"scenario_{solar_array_size}"),
+                solar_array_size=solar_array_size,
+                initial_battery_capacity=10,
+                battery_degradation_rate=0.01,
+            )
+            for solar_array_size in (20, 40)
+        ]
+
+    def test_results_of_scenarios_are_written(
+        self, tmp_path: Path, dummy_scenarios: List[Arguments]
+    ) -> None:
+        """
+        The results of each scenario should be written to the results file with the number of the scenario, and be
+        the same as the results of running the scenario on its own.
+        :param tmp_path: Temporary directory
+        :param dummy_scenarios: Dummy scenarios
+        :return: None
+        """
+        # Arrange
+        results_path = Path(tmp_path, "results.parquet")
+        # Act
+        run_batch(dummy_scenarios, results_path=results_path)
+        # Assert
+        results = pd.read_parquet(results_path)
+        assert results["scenario"].unique().tolist() == [0, 1]
+        for number, scenario in enumerate(dummy_scenarios):
+            expected_results = (
+                run_model(scenario, plot=False).results_table().to_pandas()
+            )
+            scenario_results = results[results["scenario"] == number]
+            pd.testing.assert_frame_equal(
+                scenario_results[expected_results.columns].reset_index(drop=True),
+                expected_results,
+                check_dtype=False,
+            )
+
+    def test_results_are_written_to_output_paths(
+        self, monkeypatch: pytest.MonkeyPatch, dummy_scenarios: List[Arguments]
+    ) -> None:
+        """
+        Without a results file, the results of each scenario should be written to its own output path, with the input
+        values unchanged. The results should not be plotted, as showing a plot blocks the sweep with an interactive
+        backend.
+        :param monkeypatch: Pytest monkeypatch fixture
+        :param dummy_scenarios: Dummy scenarios
+        :return: None
+        """
+        # Arrange
+        shown = []
+        monkeypatch.setattr(plt, "show", lambda *args, **kwargs: shown.append(1))
+        # Act
+        run_batch(dummy_scenarios)
+        # Assert
+        assert not shown
+        assert not Path(dummy_scenarios[0].output_path, "results.png").exists()
+        for scenario in dummy_scenarios:
+            results = pd.read_csv(Path(scenario.output_path, "optimisation_output.csv"))
+            assert len(results) == 48
+            assert (results["solar_size"] == scenario.solar_array_size).all()
+            # The input values should be written exactly as they are in the input files
+            assert (results["energy_demand"] == 0.637).all()
+            assert results["solar_irradiance"].isin([0.0, 812.3]).all()
@@ -0,0 +1,88 @@
+"""
+File containing tests for reading the scenarios of a model sweep
+"""
+from pathlib import Path
+
+import pytest
+
+from model.constants import OptimisationObjectives
+from run_sweep import read_scenarios
+
+
+class TestReadScenarios:
+    """
+    Class containing tests for the read_scenarios function. The tests are:
+    - Each row of the scenarios file is parsed into the arguments of a model run, with empty cells using the default
+    value of the argument
+    - Invalid scenarios are rejected
+    - Scenarios missing an argument required by the optimisation objective are rejected
+    """
+
+    def test_scenarios_are_parsed(self, tmp_path: Path) -> None:
+        """
+        Each row of the scenarios file should be parsed into the model arguments, with empty cells using the default
+        value of the argument.
+        :param tmp_path: Temporary directory
+        :return: None
+        """
+        # Arrange
+        scenarios_path = Path(tmp_path, "scenarios.csv")
+        scenarios_path.write_text(
+            "solar_irradiance_path,energy_demand_profile_path,output_path,solar_array_size,"
+            "optimisation_objective,battery_capex,solar_capex\n"
+            "solar.csv,demand.csv,cap,200,,,\n"
+            "solar.csv,demand.csv,cost,,minimise_battery_and_solar_cost,300,150\n",
+            encoding="utf-8",
+        )
+
+        # Act
+        scenarios = read_scenarios(scenarios_path)
+
+        # Assert
+        assert len(scenarios) == 2
+        assert scenarios[0].solar_array_size == 200
+        assert scenarios[0].battery_degradation_rate == 0.01
+        assert scenarios[1].solar_array_size is None
+        assert scenarios[1].battery_capex == 300
+        assert (
+            scenarios[1].optimisation_objective
+            == OptimisationObjectives.MINIMISE_BATTERY_AND_SOLAR_COST
+        )
+
+    def test_invalid_scenario_is_rejected(self, tmp_path: Path) -> None:
+        """
+        A scenario with an unknown optimisation objective should be rejected when the scenarios are read, before any
+        of the scenarios are run.
+        :param tmp_path: Temporary directory
+        :return: None
+        """
+        # Arrange
+        scenarios_path = Path(tmp_path, "scenarios.csv")
+        scenarios_path.write_text(
+            "solar_irradiance_path,energy_demand_profile_path,output_path,optimisation_objective\n"
+            "solar.csv,demand.csv,out,maximise_battery_cap\n",
+            encoding="utf-8",
+        )
+
+        # Act & Assert
+        with pytest.raises(SystemExit):
+            read_scenarios(scenarios_path)
+
+    def test_scenario_missing_capex_is_rejected(self, tmp_path: Path) -> None:
+        """
+        A scenario that minimises the battery and solar cost without a battery and solar capex should be rejected when
+        the scenarios are read.
+        :param tmp_path: Temporary directory
+        :return: None
+        """
+        # Arrange
+        scenarios_path = Path(tmp_path, "scenarios.csv")
+        scenarios_path.write_text(
+            "solar_irradiance_path,energy_demand_profile_path,output_path,optimisation_objective,battery_capex\n"
+            "solar.csv,demand.csv,out,minimise_battery_and_solar_cost,300\n",
+            encoding="utf-8",
+        )
+
+        # Act & Assert
+        with pytest.raises(SystemExit):
+            read_scenarios(scenarios_path)
@@ -0,0 +1,115 @@
+"""
+File containing tests for the util functions
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from model.constants import DATE_TIME
+from utils import DateTimeToNumeric
+
+
+class TestDateTimeToNumeric:
+    """
+    Class containing tests for the DateTimeToNumeric class. The tests are:
+    - Datetimes are numbered in order of first appearance, and converted back to the same datetimes
+    - Datetimes that are not in the mapping are converted to NaN
+    - Missing and unknown numeric values, including negative values, are converted to NaT
+    - Numeric values that are not whole numbers raise an error
+    - Missing datetimes are numbered like any other datetime, and converted back to NaT
+    """
+
+    @pytest.fixture
+    def datetime_to_numeric(self) -> DateTimeToNumeric:
+        """
+        Creates a DateTimeToNumeric mapping for a column with a repeated datetime.
+        :return: DateTimeToNumeric mapping
+        """
+        return DateTimeToNumeric.create(
+            pd.Series(
+                pd.to_datetime(
+                    ["2020-01-02 00:00", "2020-01-01 00:00", "2020-01-02 00:00"]
+                )
+            )
+        )
+
+    def test_datetimes_converted_to_numeric_and_back(
+        self, datetime_to_numeric: DateTimeToNumeric
+    ) -> None:
+        """
+        Each unique datetime should be numbered in order of first appearance, and converting the numbers back should
+        give the original datetimes.
+        :param datetime_to_numeric: DateTimeToNumeric mapping
+        :return: None
+        """
+        # Arrange
+        data = pd.DataFrame(
+            {DATE_TIME: pd.to_datetime(["2020-01-01 00:00", "2020-01-02 00:00"])}
+        )
+        # Act
+        numeric = datetime_to_numeric.convert_to_numeric(data)
+        datetimes = datetime_to_numeric.convert_to_datetime(
+            pd.DataFrame({"numeric": numeric}), numeric_column="numeric"
+        )
+        # Assert
+        assert numeric.tolist() == [1, 0]
+        pd.testing.assert_series_equal(datetimes, data[DATE_TIME], check_names=False)
+
+    def test_unknown_values_are_missing(
+        self, datetime_to_numeric: DateTimeToNumeric
+    ) -> None:
+        """
+        Datetimes that are not in the mapping should be converted to NaN, and missing, negative or too large numeric
+        values should be converted to NaT.
+        :param datetime_to_numeric: DateTimeToNumeric mapping
+        :return: None
+        """
+        # Arrange
+        data = pd.DataFrame(
+            {DATE_TIME: pd.to_datetime(["2020-01-01 00:00", "2021-01-01 00:00"])}
+        )
+        # Act
+        numeric = datetime_to_numeric.convert_to_numeric(data)
+        datetimes = datetime_to_numeric.convert_to_datetime(
+            pd.DataFrame({"numeric": [np.nan, -1, -5, 2, 0]}), numeric_column="numeric"
+        )
+        # Assert
+        assert numeric.iat[0] == 1
+        assert np.isnan(numeric.iat[1])
+        assert datetimes.isna().tolist() == [True, True, True, True, False]
+        assert datetimes.iat[4] == pd.Timestamp("2020-01-02 00:00")
+
+    def test_fractional_values_raise(
+        self, datetime_to_numeric: DateTimeToNumeric
+    ) -> None:
+        """
+        Numeric values that are not whole numbers should raise a ValueError, rather than being truncated to a
+        different datetime.
+        :param datetime_to_numeric: DateTimeToNumeric mapping
+        :return: None
+        """
+        # Arrange
+        data = pd.DataFrame({"numeric": [0, 0.5]})
+        # Act & Assert
+        with pytest.raises(ValueError):
+            datetime_to_numeric.convert_to_datetime(data, numeric_column="numeric")
+
+    def test_missing_datetimes_are_converted_and_back(self) -> None:
+        """
+        Missing datetimes should be numbered in order of first appearance like any other datetime, and converting
+        the numbers back should give NaT.
+        :return: None
+        """
+        # Arrange
+        data = pd.DataFrame(
+            {DATE_TIME: pd.to_datetime(["2020-01-01 00:00", None, "2020-01-02 00:00"])}
+        )
+        datetime_to_numeric = DateTimeToNumeric.create(data[DATE_TIME])
+        # Act
+        numeric = datetime_to_numeric.convert_to_numeric(data)
+        datetimes = datetime_to_numeric.convert_to_datetime(
+            pd.DataFrame({"numeric": numeric}), numeric_column="numeric"
+        )
+        # Assert
+        assert numeric.tolist() == [0, 1, 2]
+        pd.testing.assert_series_equal(datetimes, data[DATE_TIME], check_names=False)
@@ -4,10 +4,17 @@ Util functions used throughout the project.
 import logging
 from dataclasses import dataclass
 
+import numpy as np
 import pandas as pd
 
 from model.constants import DATE_TIME
 
+# Handler shared by every call to setup_logger, so the project's handler is only added to the root logger once
+_HANDLER = logging.StreamHandler()
+_HANDLER.setFormatter(
+    logging.Formatter("%(asctime)s %(levelname)s %(message)s", "%m-%d %H:%M:%S")
+)
+
 
 def setup_logger(logging_level: str = "INFO"):
     """
@@ -16,11 +23,10 @@ def setup_logger(logging_level: str = "INFO"):
     Args:
         logging_level (str): The logging level to use.
     """
-    logging.basicConfig(
-        level=logging_level,
-        format="%(asctime)s %(levelname)s %(message)s",
-        datefmt="%m-%d %H:%M:%S",
-    )
+    root_logger = logging.getLogger()
+    if _HANDLER not in root_logger.handlers:
+        root_logger.addHandler(_HANDLER)
+    root_logger.setLevel(logging_level)
 
 
 @dataclass
@@ -30,32 +36,51 @@ class DateTimeToNumeric:
     """
 
     datetime_column: pd.Series
-    mapping: dict
+    uniques: pd.DatetimeIndex
 
     @classmethod
     def create(cls, datetime_column: pd.Series) -> "DateTimeToNumeric":
         """
         Creates a DateTimeToNumeric object. Take a datetime column and created a mapping between the
-        datetime and numeric values.
+        datetime and numeric values. Each unique datetime, including NaT, is numbered in order of first appearance,
+        and the mapping is stored as an index of the unique datetimes so conversions are vectorised lookups.
         :param datetime_column:
         :return:
         """
-        mapping = {datetime: i for i, datetime in enumerate(datetime_column.unique())}
-        return cls(datetime_column, mapping)
+        _, uniques = pd.factorize(datetime_column.to_numpy(), use_na_sentinel=False)
+        return cls(datetime_column, pd.DatetimeIndex(uniques))
 
-    def convert_to_numeric(self, data: pd.DataFrame) -> pd.DataFrame:
+    def convert_to_numeric(self, data: pd.DataFrame) -> pd.Series:
         """
-        Converts the datetime column to a numeric column.
+        Converts the datetime column to a numeric column. Datetimes that are not in the mapping are converted to NaN.
         :return:
         """
-        return data[DATE_TIME].map(self.mapping)
+        codes = self.uniques.get_indexer(data[DATE_TIME].to_numpy())
+        numeric = pd.Series(codes, index=data.index, name=DATE_TIME)
+        if (codes == -1).any():
+            return numeric.mask(codes == -1)
+        return numeric
 
-    def convert_to_datetime(
-        self, data: pd.DataFrame, numeric_column: pd.Series
-    ) -> pd.DataFrame:
+    def convert_to_datetime(self, data: pd.DataFrame, numeric_column: str) -> pd.Series:
         """
-        Converts the numeric column to a datetime column.
+        Converts the numeric column to a datetime column. Numeric values that are missing or not in the mapping are
+        converted to NaT.
         :param numeric_column:
         :return:
         """
-        return data[numeric_column].map({v: k for k, v in self.mapping.items()})
+        values = data[numeric_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        missing = np.isnan(values)
+        if (np.mod(values[~missing], 1) != 0).any():
+            raise ValueError(
+                f"Numeric column {numeric_column} contains values that are not whole numbers."
+            )
+        unknown = missing | (values < 0) | (values >= len(self.uniques))
+        return pd.Series(
+            self.uniques.take(
+                np.where(unknown, -1, values).astype(np.int64),
+                allow_fill=True,
+                fill_value=pd.NaT,
+            ),
+            index=data.index,
+            name=numeric_column,
+        )